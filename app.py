@@ -1,32 +1,138 @@
 import os
+import sys
 import json
-import time
 import logging
-from flask import Flask, render_template, request, jsonify
+import uuid
+from logging.handlers import RotatingFileHandler
+from flask import Flask, render_template, request
 import threading
+import queue
+import atexit
+import itertools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import pythoncom
 from selenium import webdriver
+from selenium.webdriver.edge.options import Options as EdgeOptions
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, JavascriptException
-from email_sender import send_email
-import pyautogui
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, JavascriptException, WebDriverException, NoAlertPresentException, NoSuchWindowException
+from email_sender import send_email, init_com_once
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import waitress
+except ImportError:
+    waitress = None
+
+# Only needed for portal controls without a configured selector
+try:
+    import pyautogui
+except ImportError:
+    pyautogui = None
+
+if pyautogui is not None:
+    # Portal clicks are paced by waits on the page, not by pyautogui's built-in delays
+    pyautogui.MINIMUM_DURATION = 0
+    pyautogui.MINIMUM_SLEEP = 0
+    pyautogui.PAUSE = 0
 
 app = Flask(__name__)
 
 # Load JSON configuration
 config_path = os.path.join(os.getcwd(), 'validation_config.json')
-with open(config_path) as config_file:
-    config = json.load(config_file)
+with open(config_path, 'rb') as config_file:
+    config = orjson.loads(config_file.read()) if orjson is not None else json.load(config_file)
 
 project_name = config['project_name']
 
+
+
+def json_response(data, code=200):
+    """Build a JSON response, serializing with orjson when it is installed"""
+    body = orjson.dumps(data) if orjson is not None else json.dumps(data)
+    return app.response_class(body, status=code, mimetype='application/json')
+
+
+# Selenium strategy for each content_locator 'type' in the config
+LOCATOR_TYPES = {'css': By.CSS_SELECTOR, 'id': By.ID}
+
+
+def compile_locators(tabs):
+    """Store ready (By, value) tuples and per-sub-tab column indexes in the tab config so validations never rebuild them"""
+    for tab_data in tabs.values():
+        tab_data['tab_locator'] = (By.XPATH, f"//a[@href='{tab_data['url']}']")
+        # A tab's column_index is either one index for all its sub-tabs or a {sub_tab_name: index} map
+        column_index = tab_data.get('column_index')
+        for sub_tab_name, sub_tab_data in tab_data.get('sub_tabs', {}).items():
+            sub_tab_data['list_column'] = column_index.get(sub_tab_name) if isinstance(column_index, dict) else column_index
+        content_locators = [tab_data['content_locator']]
+        content_locators += [sub_tab_data['content_locator'] for sub_tab_data in tab_data.get('sub_tabs', {}).values()]
+        for content_locator in content_locators:
+            by = LOCATOR_TYPES.get(content_locator['type'])
+            content_locator['locator'] = (by, content_locator['value']) if by else None
+
+
+compile_locators(config['tabs'])
+
 # Set up logging
 log_file_path = os.path.join(os.getcwd(), 'validation.log')
-logging.basicConfig(filename=log_file_path, level=logging.INFO, format='%(asctime)s:%(levelname)s:%(message)s')
+log_formatter = logging.Formatter('%(asctime)s:%(levelname)s:%(message)s')
+log_handler = RotatingFileHandler(log_file_path, maxBytes=5_000_000, backupCount=3)
+log_handler.setFormatter(log_formatter)
+logging.getLogger().addHandler(log_handler)
+logging.getLogger().setLevel(logging.INFO)
+
+# Echo records to the console from the logger, so messages are formatted and written once
+console_handler = logging.StreamHandler(sys.stdout)
+console_handler.setFormatter(log_formatter)
+logging.getLogger().addHandler(console_handler)
+
+# Each run's email attaches only that run's log, written here alongside the rotating main log
+# and deleted once the email is sent; the rotating log keeps the history
+run_log_dir = os.path.join(os.getcwd(), 'logs')
+
+# Loggers of the HTTP servers; their per-request records stay out of the run log
+REQUEST_LOGGERS = ('werkzeug', 'waitress')
+
+
+def is_run_record(record):
+    """Keep a record in the run log unless an HTTP server logged it"""
+    return record.name.split('.', 1)[0] not in REQUEST_LOGGERS
+
+# Upper bound on result entries kept in memory; the full history is in the log file
+RESULTS_MAXLEN = 10000
+
+validation_status = {
+    'status': 'Not Started',
+    'results': deque(maxlen=RESULTS_MAXLEN),
+    'results_seq': 0,
+    'run_id': 0,
+    'paused': False,
+    'stopped': False
+}
+
+# Guards results and results_seq, which the worker writes while /status reads
+_results_lock = threading.Lock()
 
-validation_status = {'status': 'Not Started', 'results': [], 'paused': False, 'stopped': False}
+
+def append_result(entry):
+    """Append an entry to the status results and advance the results cursor"""
+    with _results_lock:
+        validation_status['results'].append(entry)
+        validation_status['results_seq'] += 1
+
+
+def replace_results(entries=()):
+    """Replace the status results under a new run_id, so cursor clients refetch the whole list"""
+    with _results_lock:
+        validation_status['results'] = deque(entries, maxlen=RESULTS_MAXLEN)
+        validation_status['run_id'] += 1
 
 pause_event = threading.Event()
 pause_event.set()
@@ -34,6 +140,100 @@ pause_event.set()
 stop_event = threading.Event()
 stop_event.clear()
 
+# Returns [row_count, first-row link in the given 1-based column or null] for the list view
+FIRST_LIST_ELEMENT_JS = """
+var rows = document.querySelectorAll("table.ListView > tbody > tr");
+if (rows.length <= 1) return [rows.length, null];
+var cell = rows[1].querySelectorAll(":scope > td")[arguments[0] - 1];
+return [rows.length, cell ? cell.querySelector("a") : null];
+"""
+
+def success_radio_checked(driver):
+    """True once a radio button on the results form is selected"""
+    return driver.execute_script('return document.querySelector("input[type=\'radio\']:checked") !== null')
+
+
+def confirmation_closed(driver):
+    """True once the confirmation dialog is gone, including when the results window closed with it"""
+    try:
+        driver.switch_to.alert
+    except (NoAlertPresentException, NoSuchWindowException):
+        return True
+    return False
+
+
+# Controls of the portal's results form, clicked in order: config key for the CSS selector, the
+# screen position used when no selector is configured, and the condition that holds once a click
+# at that position took effect
+PORTAL_STEPS = [
+    ('success', (536, 460), success_radio_checked),
+    ('ok', (1395, 896), EC.alert_is_present()),
+    ('confirm', (1113, 374), confirmation_closed),
+]
+portal_selectors = config.get('portal_selectors', {})
+
+# Idle Edge sessions reused across validations instead of cold-starting a browser per run
+_driver_pool = queue.Queue(maxsize=config.get('pool_size', 2))
+
+# Chromium flags that switch off background work a validation run never needs
+EDGE_ARGUMENTS = [
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-breakpad",
+    "--disable-component-extensions-with-background-pages",
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+    "--disable-features=TranslateUI",
+    "--disable-ipc-flooding-protection",
+    "--disable-renderer-backgrounding",
+    "--force-color-profile=srgb",
+    "--mute-audio",
+    "--no-sandbox",
+]
+
+
+def create_driver():
+    """Start a new Edge session with the automation flags"""
+    options = EdgeOptions()
+    for argument in EDGE_ARGUMENTS:
+        options.add_argument(argument)
+    return webdriver.Edge(options=options)
+
+
+def acquire_driver():
+    """Take an idle Edge session from the pool, starting one if none is idle"""
+    try:
+        return _driver_pool.get_nowait()
+    except queue.Empty:
+        return create_driver()
+
+
+def release_driver(driver):
+    """Reset a session and return it to the pool, quitting it if it is broken or the pool is full"""
+    try:
+        driver.delete_all_cookies()
+        driver.get('about:blank')
+        _driver_pool.put_nowait(driver)
+    except (queue.Full, WebDriverException):
+        driver.quit()
+
+
+@atexit.register
+def close_pooled_drivers():
+    while True:
+        try:
+            _driver_pool.get_nowait().quit()
+        except queue.Empty:
+            break
+        except WebDriverException:
+            pass
+
+
+# One long-lived worker runs validations; they share validation_status, so they never overlap
+# init_com_once sets up COM for the worker's lifetime, so every run's email reuses one Outlook object
+validation_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='validation', initializer=init_com_once)
+validation_future = None
+
 
 def validate_application(environment, validation_portal_link=None):
     global validation_status
@@ -43,39 +243,34 @@ def validate_application(environment, validation_portal_link=None):
         raise ValueError("Invalid environment selected. Please choose 'IT', 'QV', or 'Prod'.")
 
     logging.info(f"Selected environment: {environment}")
-    validation_status['results'].append(f"Selected environment: {environment}")
-
-    # Initialize Edge WebDriver
-    driver = webdriver.Edge()
+    append_result(f"Selected environment: {environment}")
 
     validation_results = []
+    # A tab worker collects its entries in its own list; run_tab hands them back to be merged in tab order
+    tab_log = threading.local()
 
     def log_and_update_status(message, status="Success"):
-        print(message)
         logging.info(message)
-        validation_results.append((message, status))
-        validation_status['results'].append(message)
+        tab_results = getattr(tab_log, 'results', None)
+        (validation_results if tab_results is None else tab_results).append((message, status))
+        append_result(message)
 
     # Function to highlight an element
-    def highlight(element):
+    def highlight(driver, element):
         driver.execute_script("arguments[0].setAttribute('style', arguments[1]);", element, "background: yellow; border: 2px solid red;")
 
     # Function to check if a tab opens properly
-    def check_tab(tab_element, tab_name, content_locator, index):
+    def check_tab(driver, tab_element, tab_name, content_locator, index):
         pause_event.wait()
         if stop_event.is_set():
             return False
 
         try:
-            highlight(tab_element)
-            time.sleep(1)
+            highlight(driver, tab_element)
             tab_element.click()
-            locator_type = content_locator['type']
-            locator_value = content_locator['value']
-            if locator_type == 'css':
-                WebDriverWait(driver, 3).until(EC.visibility_of_element_located((By.CSS_SELECTOR, locator_value)))
-            elif locator_type == 'id':
-                WebDriverWait(driver, 3).until(EC.visibility_of_element_located((By.ID, locator_value)))
+            # The content container is visible once mounted, so presence is enough and skips the size queries
+            if content_locator['locator']:
+                WebDriverWait(driver, 3, poll_frequency=0.1).until(EC.presence_of_element_located(content_locator['locator']))
             result = f"{index}. Main Tab '{tab_name}' opened successfully."
             log_and_update_status(result)
             return True
@@ -85,20 +280,15 @@ def validate_application(environment, validation_portal_link=None):
             return False
 
     # Function to check if a sub-tab opens properly by executing JavaScript
-    def check_sub_tab(sub_tab_js, sub_tab_name, content_locator, main_index, sub_index):
+    def check_sub_tab(driver, sub_tab_js, sub_tab_name, content_locator, main_index, sub_index):
         pause_event.wait()
         if stop_event.is_set():
             return False
 
         try:
-            time.sleep(1)
             driver.execute_script(sub_tab_js)
-            locator_type = content_locator['type']
-            locator_value = content_locator['value']
-            if locator_type == 'css':
-                WebDriverWait(driver, 3).until(EC.visibility_of_element_located((By.CSS_SELECTOR, locator_value)))
-            elif locator_type == 'id':
-                WebDriverWait(driver, 3).until(EC.visibility_of_element_located((By.ID, locator_value)))
+            if content_locator['locator']:
+                WebDriverWait(driver, 3, poll_frequency=0.1).until(EC.presence_of_element_located(content_locator['locator']))
             result = f"{main_index}.{chr(96 + sub_index)}. Sub Tab '{sub_tab_name}' opened successfully."
             log_and_update_status(result)
             return True
@@ -112,38 +302,36 @@ def validate_application(environment, validation_portal_link=None):
             return False
 
     # Function to validate the first list element under the specified column and click the cancel button
-    def validate_first_list_element_and_cancel(column_index, main_index, sub_index, is_export_control=False):
+    def validate_first_list_element_and_cancel(driver, column_index, main_index, sub_index, is_export_control=False):
         pause_event.wait()
         if stop_event.is_set():
             return False
 
         try:
             WebDriverWait(driver, 3).until(EC.visibility_of_element_located((By.CSS_SELECTOR, "table.ListView")))
-            rows = driver.find_elements(By.XPATH, f"//table[@class='ListView']/tbody/tr")
-            if len(rows) <= 1:
+            # Row count and the first row's link in one round trip
+            row_count, first_element = driver.execute_script(FIRST_LIST_ELEMENT_JS, column_index)
+            if row_count <= 1:
                 result = f"{main_index}.{chr(96 + sub_index)}. There is no data in the sub tab '{sub_index}' to check so skipping."
                 log_and_update_status(result, "Skipped")
                 return True
 
             try:
-                first_element = driver.find_element(By.XPATH, f"//table[@class='ListView']/tbody/tr[2]/td[{column_index}]/a")
-                highlight(first_element)
-                time.sleep(1)
-                first_element.click()
-                WebDriverWait(driver, 3).until(EC.visibility_of_element_located((By.CSS_SELECTOR, "div#content")))
-
-                time.sleep(1)
+                if first_element is None:
+                    raise NoSuchElementException(f"No link in column {column_index} of the first row")
+                highlight(driver, first_element)
+                WebDriverWait(driver, 5, poll_frequency=0.1).until(EC.element_to_be_clickable(first_element)).click()
+                WebDriverWait(driver, 3, poll_frequency=0.1).until(EC.visibility_of_element_located((By.CSS_SELECTOR, "div#content")))
 
                 if is_export_control:
-                    cancel_button = WebDriverWait(driver, 3).until(
+                    cancel_button = WebDriverWait(driver, 5, poll_frequency=0.1).until(
                         EC.element_to_be_clickable((By.XPATH, "//img[@src='/fpa/images/btn_cancel.jpg']"))
                     )
                 else:
-                    cancel_button = WebDriverWait(driver, 3).until(
+                    cancel_button = WebDriverWait(driver, 5, poll_frequency=0.1).until(
                         EC.element_to_be_clickable((By.XPATH, "//img[@src='/fpa/images/btn_cancel.gif']"))
                     )
-                highlight(cancel_button)
-                time.sleep(1)
+                highlight(driver, cancel_button)
                 cancel_button.click()
 
                 return True
@@ -156,31 +344,23 @@ def validate_application(environment, validation_portal_link=None):
             log_and_update_status(result, "Failed")
             return False
 
-    driver.get(url)
-    logging.info(f"Navigated to {url}")
-    validation_status['results'].append(f"Navigated to {url}")
-
-    all_tabs_opened = True
-
-    def handle_sub_tabs(tab_name, sub_tabs, main_index):
-        global all_tabs_opened
+    def handle_sub_tabs(driver, tab_name, sub_tabs, main_index):
         sub_tab_results = []
+        sub_tabs_ok = True
         for sub_index, (sub_tab_name, sub_tab_data) in enumerate(sub_tabs.items(), start=1):
-            sub_success = check_sub_tab(sub_tab_data['script'], sub_tab_name, sub_tab_data['content_locator'], main_index, sub_index)
+            sub_success = check_sub_tab(driver, sub_tab_data['script'], sub_tab_name, sub_tab_data['content_locator'], main_index, sub_index)
             is_export_control = tab_name == "Positive Pay" and sub_tab_name == "Export Control"
             if sub_success:
-                column_index = config['tabs'][tab_name]['column_index']
-                if isinstance(column_index, dict):
-                    column_index = column_index.get(sub_tab_name)
+                column_index = sub_tab_data['list_column']
                 if column_index is not None:
-                    first_list_element_success = validate_first_list_element_and_cancel(column_index, main_index, sub_index, is_export_control=is_export_control)
+                    first_list_element_success = validate_first_list_element_and_cancel(driver, column_index, main_index, sub_index, is_export_control=is_export_control)
                     if not first_list_element_success:
-                        all_tabs_opened = False
+                        sub_tabs_ok = False
                 else:
                     result = f"{main_index}.{chr(96 + sub_index)}. There is no data in the sub tab '{sub_tab_name}' to check so skipping."
                     log_and_update_status(result, "Skipped")
             else:
-                all_tabs_opened = False
+                sub_tabs_ok = False
 
             if sub_success:
                 result = f"{main_index}.{chr(96 + sub_index)}. Sub Tab '{sub_tab_name}' opened successfully."
@@ -189,36 +369,76 @@ def validate_application(environment, validation_portal_link=None):
                 result = f"{main_index}.{chr(96 + sub_index)}. Failed to open Sub Tab '{sub_tab_name}'."
                 sub_tab_results.append((result, "Failed"))
 
-        return sub_tab_results
+        return sub_tab_results, sub_tabs_ok
 
-    for i, (tab_name, tab_data) in enumerate(config['tabs'].items(), start=1):
+    # Drivers free for the next tab; each tab borrows one for its duration
+    tab_drivers = queue.Queue()
+
+    def run_tab(i, tab_name, tab_data):
+        """Validate one main tab and its sub-tabs, returning (tab_ok, tab_results)"""
+        driver = tab_drivers.get()
+        tab_log.results = []
+        try:
+            tab_ok, sub_tab_results = validate_tab(driver, i, tab_name, tab_data)
+            return tab_ok, tab_log.results + sub_tab_results
+        finally:
+            tab_log.results = None
+            tab_drivers.put(driver)
+
+    def validate_tab(driver, i, tab_name, tab_data):
+        """Open one main tab and its sub-tabs, returning (tab_ok, sub_tab_results)"""
         try:
             tab_element = WebDriverWait(driver, 3).until(
-                EC.element_to_be_clickable((By.XPATH, f"//a[@href='{tab_data['url']}']"))
+                EC.element_to_be_clickable(tab_data['tab_locator'])
             )
-            highlight(tab_element)
-            time.sleep(1)
-            success = check_tab(tab_element, tab_name, tab_data['content_locator'], i)
-            if success:
-                result = f"{i}. Main Tab '{tab_name}' opened successfully."
-                log_and_update_status(result)
-
-                if 'sub_tabs' in tab_data:
-                    sub_tab_results = handle_sub_tabs(tab_name, tab_data['sub_tabs'], i)
-                    validation_results.extend(sub_tab_results)
-
-            else:
+            highlight(driver, tab_element)
+            success = check_tab(driver, tab_element, tab_name, tab_data['content_locator'], i)
+            if not success:
                 result = f"{i}. Failed to open Main Tab '{tab_name}'."
                 log_and_update_status(result, "Failed")
-                all_tabs_opened = False
+                return False, []
+
+            result = f"{i}. Main Tab '{tab_name}' opened successfully."
+            log_and_update_status(result)
+
+            if 'sub_tabs' in tab_data:
+                sub_tab_results, sub_tabs_ok = handle_sub_tabs(driver, tab_name, tab_data['sub_tabs'], i)
+                return sub_tabs_ok, sub_tab_results
+            return True, []
 
         except (TimeoutException, NoSuchElementException) as e:
             result = f"{i}. Main Tab '{tab_name}' not found or not clickable. Exception: {e}"
             log_and_update_status(result, "Failed")
-            all_tabs_opened = False
+            return False, []
+        except WebDriverException as e:
+            # A stale or intercepted element fails this tab only; the other tabs still run
+            result = f"{i}. Error on Main Tab '{tab_name}': {e}"
+            log_and_update_status(result, "Failed")
+            return False, []
 
-    time.sleep(1)
-    driver.quit()
+    # One warm session per worker, each opened on the environment before the tabs fan out
+    worker_count = max(1, min(_driver_pool.maxsize, len(config['tabs'])))
+    drivers = []
+    try:
+        for _ in range(worker_count):
+            driver = acquire_driver()
+            drivers.append(driver)
+            driver.get(url)
+            tab_drivers.put(driver)
+        logging.info(f"Navigated to {url}")
+        append_result(f"Navigated to {url}")
+
+        all_tabs_opened = True
+        tab_args = [(i, tab_name, tab_data) for i, (tab_name, tab_data) in enumerate(config['tabs'].items(), start=1)]
+        with ThreadPoolExecutor(max_workers=worker_count) as tab_executor:
+            # map() yields in tab order, so each tab's entries stay together whichever worker finishes first
+            for tab_ok, tab_results in tab_executor.map(lambda args: run_tab(*args), tab_args):
+                validation_results.extend(tab_results)
+                all_tabs_opened = all_tabs_opened and tab_ok
+    finally:
+        # Hand the sessions back for the next run instead of quitting the browsers
+        for driver in drivers:
+            release_driver(driver)
 
     if all_tabs_opened:
         result = ("Validation completed successfully.", "Success")
@@ -235,57 +455,120 @@ def validate_application(environment, validation_portal_link=None):
 
 
 def submit_test_results(validation_portal_link):
+    driver = acquire_driver()
     try:
-        driver = webdriver.Edge()
         driver.get(validation_portal_link)
 
         # Locate the "Set Testing Results" button and click it
         set_results_button = WebDriverWait(driver, 10).until(
             EC.element_to_be_clickable((By.XPATH, "//button[contains(text(),'Set Testing Results')]"))
         )
+        window_count = len(driver.window_handles)
         set_results_button.click()
-        time.sleep(5)  # Wait for the new page to load
-
-        # Use pyautogui for clicking success radio button and OK buttons
-        pyautogui.click(536, 460)  # Click Success
-        time.sleep(1)
-        pyautogui.click(1395, 896)  # Click OK
-        time.sleep(1)
-        pyautogui.click(1113, 374)  # Confirm OK
+
+        first_selector = portal_selectors.get(PORTAL_STEPS[0][0])
+
+        # The results form opens either in a new window or on the same page
+        def form_ready(d):
+            if len(d.window_handles) > window_count:
+                return True
+            return bool(first_selector and d.find_elements(By.CSS_SELECTOR, first_selector))
+
+        try:
+            WebDriverWait(driver, 5, poll_frequency=0.1).until(form_ready)
+        except TimeoutException:
+            pass
+        if len(driver.window_handles) > window_count:
+            driver.switch_to.window(driver.window_handles[-1])
+
+        for step, (x, y), clicked in PORTAL_STEPS:
+            selector = portal_selectors.get(step)
+            if selector:
+                WebDriverWait(driver, 10, poll_frequency=0.1).until(
+                    EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
+                ).click()
+                continue
+
+            # No selector configured for this control: fall back to its screen position and wait
+            # for the state the click produces
+            if pyautogui is None:
+                raise RuntimeError(f"pyautogui is not installed and no selector is configured for '{step}'")
+            pyautogui.click(x, y)
+            try:
+                WebDriverWait(driver, 5, poll_frequency=0.1).until(clicked)
+            except TimeoutException:
+                logging.warning(f"Portal '{step}' click had no visible effect within 5s")
         logging.info("Test results successfully submitted via Validation Portal.")
 
     except Exception as e:
         logging.error(f"Error submitting results to validation portal: {e}")
     finally:
-        driver.quit()
+        release_driver(driver)
+
+
+# The home page only depends on project_name, so it is rendered once on first request
+_home_html = None
 
 
 @app.route('/')
 def home():
-    return render_template('index.html', project_name=project_name)
+    global _home_html
+    if _home_html is None:
+        _home_html = render_template('index.html', project_name=project_name)
+    return _home_html
 
 
 @app.route('/start_validation', methods=['POST'])
 def start_validation():
-    global stop_event, pause_event
+    global stop_event, pause_event, validation_future
+    if validation_future is not None and not validation_future.done():
+        return json_response({"error": "Validation already in progress"}, 409)
     stop_event.clear()
     pause_event.set()
     data = request.json
     environment = data.get('environment')
     validation_portal_link = data.get('validation_portal_link', None)
     validation_status['status'] = 'Running'
-    validation_status['results'] = []
+    replace_results()
 
     def validate_environment():
-        results, success = validate_application(environment, validation_portal_link)
-        validation_status['status'] = 'Completed' if success else 'Failed'
-        validation_status['results'] = results
-        subject = f"{project_name} {environment.upper()} Environment Validation Results"
-        send_email(subject, results, success, log_file_path)
+        # Capture this run's records in their own file; request logs from /status polling stay out
+        os.makedirs(run_log_dir, exist_ok=True)
+        run_log_path = os.path.join(run_log_dir, f"validation-{uuid.uuid4().hex}.log")
+        run_log_handler = logging.FileHandler(run_log_path)
+        run_log_handler.setFormatter(log_formatter)
+        run_log_handler.addFilter(is_run_record)
+        logging.getLogger().addHandler(run_log_handler)
+        try:
+            # Nothing reads this future's result, so failures are logged and shown in the status here
+            try:
+                results, success = validate_application(environment, validation_portal_link)
+            except Exception as e:
+                logging.exception("Validation run failed")
+                validation_status['status'] = 'Failed'
+                append_result(f"Validation run failed: {e}")
+                return
+            finally:
+                # Closing flushes the file, so Outlook attaches a complete log
+                logging.getLogger().removeHandler(run_log_handler)
+                run_log_handler.close()
+            validation_status['status'] = 'Completed' if success else 'Failed'
+            # The same messages as streamed, now grouped in tab order
+            replace_results(message for message, _ in results)
+            subject = f"{project_name} {environment.upper()} Environment Validation Results"
+            try:
+                send_email(subject, results, success, run_log_path)
+            except Exception:
+                logging.exception("Failed to send validation results email")
+        finally:
+            # The sent mail carries its own copy of the attachment
+            try:
+                os.remove(run_log_path)
+            except OSError as e:
+                logging.warning(f"Could not delete run log {run_log_path}: {e}")
 
-    thread = threading.Thread(target=validate_environment)
-    thread.start()
-    return jsonify({"message": "Validation started"}), 202
+    validation_future = validation_executor.submit(validate_environment)
+    return json_response({"message": "Validation started"}, 202)
 
 
 @app.route('/pause_resume_validation', methods=['POST'])
@@ -299,7 +582,7 @@ def pause_resume_validation():
         validation_status['paused'] = False
         pause_event.set()
         validation_status['status'] = 'Running'
-    return jsonify({"message": "Validation paused/resumed"}), 200
+    return json_response({"message": "Validation paused/resumed"}, 200)
 
 
 @app.route('/stop_validation', methods=['POST'])
@@ -307,13 +590,33 @@ def stop_validation():
     global stop_event, validation_status
     stop_event.set()
     validation_status['status'] = 'Stopped'
-    return jsonify({"message": "Validation stopped"}), 200
+    return json_response({"message": "Validation stopped"}, 200)
 
 
 @app.route('/status')
 def status():
-    return jsonify(validation_status)
+    # Clients pass the run_id and last results_seq they saw to receive only newer entries;
+    # after the list was replaced (new run_id) they get all of it again
+    since = request.args.get('since', type=int)
+    run_id = request.args.get('run_id', type=int)
+    with _results_lock:
+        results = validation_status['results']
+        if since is None or run_id != validation_status['run_id']:
+            new_count = len(results)
+        else:
+            new_count = validation_status['results_seq'] - since
+        if new_count < 0 or new_count > len(results):
+            new_count = len(results)
+        body = {**validation_status, 'results': list(itertools.islice(results, len(results) - new_count, None))}
+    return json_response(body)
 
 
 if __name__ == '__main__':
-    app.run(debug=True)
+    host = os.environ.get('HOST', '0.0.0.0')
+    port = int(os.environ.get('PORT', '5000'))
+    debug = os.environ.get('FLASK_DEBUG') == '1'
+    # Validation state lives in this process, so serve it from one process with threads
+    if waitress is not None and not debug:
+        waitress.serve(app, host=host, port=port, threads=8)
+    else:
+        app.run(host=host, port=port, debug=debug, threaded=True)
@@ -1,109 +1,122 @@
-def send_email(subject, validation_results, success, log_file_path):
-    """Send a beautifully formatted email with validation results"""
-    # Calculate summary statistics
-    total_checks = len(validation_results)
-    success_count = sum(1 for _, status in validation_results if status == "Success")
-    failed_count = sum(1 for _, status in validation_results if status == "Failed")
-    skipped_count = sum(1 for _, status in validation_results if status == "Skipped")
-    success_rate = (success_count / total_checks * 100) if total_checks > 0 else 0
+import os
+import smtplib
+import threading
+from collections import Counter
+from datetime import datetime
+from email.message import EmailMessage
+from string import Template
+
+import pythoncom
+import pywintypes
+import win32com.client as win32
+import winerror
 
-    # Email template with compact table summary
-    email_body = f"""
+__all__ = ['send_email', 'SmtpMailer', 'init_com_once']
+
+# Recipients of the validation report
+EMAIL_TO = 'Pratik_Bhongade@keybank.com'  # Replace with actual recipient(s)
+EMAIL_CC = 'team@example.com'  # Add CC recipients if needed
+
+# Delivery backend: "outlook" (default, COM automation) or "smtp" (settings from the SMTP_* variables)
+EMAIL_BACKEND = os.environ.get('EMAIL_BACKEND', 'outlook')
+
+# Email markup and CSS, parsed once at import; send_email only substitutes the per-run values
+_EMAIL_TEMPLATE = Template("""
     <html>
     <head>
         <style>
-            body {{ font-family: 'Segoe UI', Arial, sans-serif; line-height: 1.6; color: #333; }}
-            .container {{ max-width: 800px; margin: 0 auto; padding: 20px; }}
-            .header {{ text-align: center; padding-bottom: 20px; }}
+            body { font-family: 'Segoe UI', Arial, sans-serif; line-height: 1.6; color: #333; }
+            .container { max-width: 800px; margin: 0 auto; padding: 20px; }
+            .header { text-align: center; padding-bottom: 20px; }
             
             /* Compact Summary Table */
-            .summary-table {{
+            .summary-table {
                 width: 100%;
                 border-collapse: collapse;
                 margin: 15px 0;
                 background: #f8f9fa;
                 border-radius: 5px;
                 overflow: hidden;
-            }}
-            .summary-table td {{
+            }
+            .summary-table td {
                 padding: 10px 12px;
                 text-align: center;
                 border-right: 1px solid #e0e0e0;
                 font-size: 14px;
-            }}
-            .summary-table td:last-child {{ border-right: none; }}
-            .summary-table .stat-value {{
+            }
+            .summary-table td:last-child { border-right: none; }
+            .summary-table .stat-value {
                 font-weight: bold;
                 font-size: 16px;
-            }}
-            .total-stat .stat-value {{ color: #495057; }}
-            .success-stat .stat-value {{ color: #28a745; }}
-            .failed-stat .stat-value {{ color: #dc3545; }}
-            .skipped-stat .stat-value {{ color: #ffc107; }}
-            .rate-stat .stat-value {{ color: { '#28a745' if success_rate >= 90 else '#ffc107' if success_rate >= 70 else '#dc3545' }; }}
+            }
+            .total-stat .stat-value { color: #495057; }
+            .success-stat .stat-value { color: #28a745; }
+            .failed-stat .stat-value { color: #dc3545; }
+            .skipped-stat .stat-value { color: #ffc107; }
+            .rate-stat .stat-value { color: $rate_color; }
             
             /* Results Section */
-            .result-container {{ 
+            .result-container { 
                 background: #f9f9f9; 
                 border-radius: 5px; 
                 padding: 15px; 
                 margin: 15px 0;
                 border: 1px solid #eaeaea;
-            }}
-            .result-item {{ 
+            }
+            .result-item { 
                 padding: 8px 0; 
                 border-bottom: 1px solid #eee; 
                 display: flex;
-            }}
-            .result-index {{
+            }
+            .result-index {
                 font-weight: bold;
                 margin-right: 10px;
                 color: #6c757d;
                 min-width: 30px;
-            }}
-            .success {{ color: #28a745; }}
-            .failed {{ color: #dc3545; }}
-            .skipped {{ color: #ffc107; }}
+            }
+            .success { color: #28a745; }
+            .failed { color: #dc3545; }
+            .skipped { color: #ffc107; }
             
             /* Status Banner */
-            .status-banner {{ 
+            .status-banner { 
                 padding: 12px; 
                 text-align: center; 
                 font-size: 16px; 
                 font-weight: bold; 
                 border-radius: 5px;
                 margin: 15px 0;
-                background-color: {'#d4edda' if success else '#f8d7da'};
-                color: {'#155724' if success else '#721c24'};
-            }}
+                background-color: $banner_background;
+                color: $banner_color;
+            }
             
             /* Footer */
-            .footer {{ 
+            .footer { 
                 margin-top: 20px; 
                 padding-top: 15px; 
                 border-top: 1px solid #eaeaea;
                 font-size: 13px;
-            }}
-            .footer p {{
+            }
+            .footer p {
                 margin: 8px 0;
-            }}
-            .next-steps {{
+            }
+            .next-steps {
                 margin-top: 15px;
                 padding-left: 20px;
-            }}
-            .next-steps li {{
+            }
+            .next-steps li {
                 margin-bottom: 5px;
-            }}
-            .signature {{
+            }
+            .signature {
                 margin-top: 15px;
                 line-height: 1.4;
-            }}
-            .timestamp {{
+            }
+            .timestamp {
                 color: #6c757d; 
                 font-size: 12px;
                 text-align: center;
                 margin-top: 20px;
-            }}
+            }
         </style>
     </head>
     <body>
@@ -120,23 +133,23 @@ def send_email(subject, validation_results, success, log_file_path):
             <table class="summary-table">
                 <tr>
                     <td class="total-stat">
-                        <div class="stat-value">{total_checks}</div>
+                        <div class="stat-value">$total_checks</div>
                         <div>Total</div>
                     </td>
                     <td class="success-stat">
-                        <div class="stat-value">{success_count}</div>
+                        <div class="stat-value">$success_count</div>
                         <div>Passed</div>
                     </td>
                     <td class="failed-stat">
-                        <div class="stat-value">{failed_count}</div>
+                        <div class="stat-value">$failed_count</div>
                         <div>Failed</div>
                     </td>
                     <td class="skipped-stat">
-                        <div class="stat-value">{skipped_count}</div>
+                        <div class="stat-value">$skipped_count</div>
                         <div>Skipped</div>
                     </td>
                     <td class="rate-stat">
-                        <div class="stat-value">{success_rate:.1f}%</div>
+                        <div class="stat-value">${success_rate}%</div>
                         <div>Success Rate</div>
                     </td>
                 </tr>
@@ -145,23 +158,10 @@ def send_email(subject, validation_results, success, log_file_path):
             <!-- Detailed Results -->
             <div class="result-container">
                 <h3>Detailed Results:</h3>
-    """
-
-    # Add validation results
-    for i, (result, status) in enumerate(validation_results, 1):
-        status_class = "success" if status == "Success" else "failed" if status == "Failed" else "skipped"
-        email_body += f"""
-        <div class="result-item">
-            <div class="result-index">{i}.</div>
-            <div><span class="{status_class}">[{status}]</span> {result}</div>
-        </div>
-        """
-
-    # Add status banner and footer
-    email_body += f"""
+    $rows
             </div>
             <div class="status-banner">
-                {'✅ All checks passed successfully' if success else '❌ Validation completed with failures'}
+                $banner_text
             </div>
             
             <div class="footer">
@@ -182,29 +182,188 @@ def send_email(subject, validation_results, success, log_file_path):
                 </div>
                 
                 <div class="timestamp">
-                    <p>Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
+                    <p>Generated on: $generated_on</p>
                     <p>This is an automated message - please do not reply directly</p>
                 </div>
             </div>
         </div>
     </body>
     </html>
+    """)
+
+# Status banner (text, background, colour) for a passing and a failing run
+_SUCCESS_BANNER = ('✅ All checks passed successfully', '#d4edda', '#155724')
+_FAILED_BANNER = ('❌ Validation completed with failures', '#f8d7da', '#721c24')
+
+# CSS class of each result status; anything else renders as skipped
+STATUS_CLASS = {"Success": "success", "Failed": "failed", "Skipped": "skipped"}
+
+# Markup of one result row; formatted per row and joined in a single pass
+_ROW_FORMAT = """
+        <div class="result-item">
+            <div class="result-index">{index}.</div>
+            <div><span class="{status_class}">[{status}]</span> {result}</div>
+        </div>
+        """
+
+# Outlook COM objects belong to the apartment of the thread that created them. A long-lived
+# sending thread initializes COM once and keeps its own Outlook reference; any other thread
+# initializes COM for a single send and uninitializes it afterwards
+_com_state = threading.local()
+
+
+def _co_initialize():
+    """
+    Initialize COM on the calling thread.
+
+    Returns:
+        bool: True if a matching CoUninitialize is owed; False if the host already initialized
+        the thread in another apartment mode, which is used as is.
+    """
+    try:
+        pythoncom.CoInitializeEx(pythoncom.COINIT_APARTMENTTHREADED)
+    except pythoncom.com_error as e:
+        if e.hresult != winerror.RPC_E_CHANGED_MODE:
+            raise
+        return False
+    return True
+
+
+def init_com_once():
+    """
+    Initialize COM on the calling thread for the rest of its life, unless that was already done.
+
+    Long-lived sending threads (e.g. a worker pool's initializer) call this once; send_email then
+    skips COM initialization and reuses the thread's Outlook object on every send.
+    """
+    if getattr(_com_state, 'initialized', False):
+        return
+    _co_initialize()
+    _com_state.initialized = True
+
+
+def _get_outlook(refresh=False):
+    """Return this thread's cached Outlook application, dispatching it on first use"""
+    if refresh or getattr(_com_state, 'outlook', None) is None:
+        try:
+            # Early-bound wrapper from the generated type library; property sets skip the name lookups
+            _com_state.outlook = win32.gencache.EnsureDispatch('Outlook.Application')
+        except Exception:
+            # The gen_py cache cannot be built here (e.g. read-only install); use late binding
+            _com_state.outlook = win32.Dispatch('Outlook.Application')
+    return _com_state.outlook
+
+
+class SmtpMailer:
+    """
+    Send HTML mails over one SMTP connection that is kept open between sends.
+
+    Args:
+        host (str): SMTP server host.
+        port (int): SMTP server port; STARTTLS is negotiated on it.
+        username (str): Login name, or None to send without authenticating.
+        password (str): Login password.
+        sender (str): From address; defaults to the username.
     """
 
-    pythoncom.CoInitialize()
+    def __init__(self, host, port=587, username=None, password=None, sender=None):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.sender = sender or username
+        self._smtp = None
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        smtp = smtplib.SMTP(self.host, self.port, timeout=30)
+        smtp.starttls()
+        if self.username:
+            smtp.login(self.username, self.password)
+        self._smtp = smtp
+
+    def send(self, subject, html, attachments=(), to=EMAIL_TO, cc=EMAIL_CC, plain=None):
+        """
+        Send one message, reconnecting once if the server dropped the kept-open connection.
+
+        Args:
+            subject (str): Subject line.
+            html (str): HTML body.
+            attachments (iterable): Paths of files to attach.
+            to (str): Comma-separated recipients.
+            cc (str): Comma-separated CC recipients.
+            plain (str): Plain-text alternative for clients without HTML.
+        """
+        msg = EmailMessage()
+        msg['Subject'] = subject
+        msg['From'] = self.sender
+        msg['To'] = to
+        if cc:
+            msg['Cc'] = cc
+        msg.set_content(plain or subject)
+        msg.add_alternative(html, subtype='html')
+        for path in attachments:
+            with open(path, 'rb') as f:
+                msg.add_attachment(f.read(), maintype='application', subtype='octet-stream', filename=os.path.basename(path))
+
+        with self._lock:
+            if self._smtp is None:
+                self._connect()
+            try:
+                self._smtp.send_message(msg)
+            except smtplib.SMTPServerDisconnected:
+                self._connect()
+                self._smtp.send_message(msg)
+
+    def close(self):
+        """Close the kept-open connection, if any"""
+        with self._lock:
+            if self._smtp is not None:
+                try:
+                    self._smtp.quit()
+                except smtplib.SMTPException:
+                    pass
+                self._smtp = None
+
+
+_mailer = None
+_mailer_lock = threading.Lock()
+
+
+def _get_mailer():
+    """Return the shared SmtpMailer, created from the SMTP_* environment variables on first use"""
+    global _mailer
+    with _mailer_lock:
+        if _mailer is None:
+            _mailer = SmtpMailer(
+                os.environ['SMTP_HOST'],
+                int(os.environ.get('SMTP_PORT', '587')),
+                os.environ.get('SMTP_USER'),
+                os.environ.get('SMTP_PASSWORD'),
+                os.environ.get('SMTP_SENDER')
+            )
+        return _mailer
+
+
+def _send_with_outlook(subject, email_body, log_file_path):
+    """Create and send the report mail through this thread's Outlook application"""
+    mail = None
     try:
-        outlook = win32.Dispatch('outlook.application')
-        mail = outlook.CreateItem(0)
-        mail.To = 'Pratik_Bhongade@keybank.com'  # Replace with actual recipient(s)
-        mail.CC = 'team@example.com'  # Add CC recipients if needed
+        try:
+            mail = _get_outlook().CreateItem(0)
+        except Exception:
+            # Outlook was restarted since the reference was cached; dispatch it again
+            mail = _get_outlook(refresh=True).CreateItem(0)
+        mail.To = EMAIL_TO
+        mail.CC = EMAIL_CC
         mail.Subject = subject
         mail.HTMLBody = email_body
 
-        # Add attachments
-        if os.path.exists(log_file_path):
-            mail.Attachments.Add(log_file_path)
-        else:
-            print(f"Log file not found: {log_file_path}")
+        # Add attachments; Outlook reports a missing file itself, so there is no separate existence check
+        try:
+            mail.Attachments.Add(Source=log_file_path, Type=1)  # 1 = olByValue
+        except pywintypes.com_error as e:
+            print(f"Attachment failed: {log_file_path} {e}")
 
         mail.Send()
         print("Email sent successfully with enhanced summary section!")
@@ -213,4 +372,75 @@ def send_email(subject, validation_results, success, log_file_path):
         print(f"Failed to send email: {str(e)}")
         raise
     finally:
-        pythoncom.CoUninitialize()
+        # Drop the mail item here, not when a traceback holding this frame is freed
+        mail = None
+
+
+def send_email(subject, validation_results, success, log_file_path, backend=None):
+    """Send a beautifully formatted email with validation results"""
+    backend = backend or EMAIL_BACKEND
+    generated_on = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+    # Calculate summary statistics
+    total_checks = len(validation_results)
+    counts = Counter(status for _, status in validation_results)
+    success_count = counts["Success"]
+    failed_count = counts["Failed"]
+    skipped_count = counts["Skipped"]
+    success_rate = (success_count / total_checks * 100) if total_checks > 0 else 0
+
+    # Only the counts, colours and rows vary between emails; the markup and CSS are in _EMAIL_TEMPLATE
+    # join() sizes its buffer from a list up front; a generator would be copied into one first anyway
+    rows = "".join([
+        _ROW_FORMAT.format(
+            index=i,
+            status_class=STATUS_CLASS.get(status, "skipped"),
+            status=status,
+            result=result
+        )
+        for i, (result, status) in enumerate(validation_results, 1)
+    ])
+
+    banner_text, banner_background, banner_color = _SUCCESS_BANNER if success else _FAILED_BANNER
+    email_body = _EMAIL_TEMPLATE.substitute(
+        rate_color='#28a745' if success_rate >= 90 else '#ffc107' if success_rate >= 70 else '#dc3545',
+        banner_background=banner_background,
+        banner_color=banner_color,
+        total_checks=total_checks,
+        success_count=success_count,
+        failed_count=failed_count,
+        skipped_count=skipped_count,
+        success_rate=f"{success_rate:.1f}",
+        rows=rows,
+        banner_text=banner_text,
+        generated_on=generated_on
+    )
+
+    if backend == "smtp":
+        attachments = [log_file_path] if os.path.exists(log_file_path) else []
+        if not attachments:
+            print(f"Log file not found: {log_file_path}")
+        plain = f"{subject}\n\n{success_count}/{total_checks} checks passed, {failed_count} failed, {skipped_count} skipped."
+        try:
+            _get_mailer().send(subject, email_body, attachments, plain=plain)
+            print("Email sent successfully with enhanced summary section!")
+        except Exception as e:
+            print(f"Failed to send email: {str(e)}")
+            raise
+        return
+
+    # Threads that called init_com_once keep COM and their Outlook object between sends; any other
+    # thread (e.g. one started per validation run) initializes COM for this send only
+    if getattr(_com_state, 'initialized', False):
+        _send_with_outlook(subject, email_body, log_file_path)
+        return
+
+    owes_uninitialize = _co_initialize()
+    try:
+        _send_with_outlook(subject, email_body, log_file_path)
+    finally:
+        # Release the Outlook object before its apartment goes away
+        _com_state.outlook = None
+        if owes_uninitialize:
+            pythoncom.CoUninitialize()
+
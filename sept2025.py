@@ -4,11 +4,18 @@ import json
 import time
 import logging
 import traceback
-from flask import Flask, render_template, request, jsonify, abort, make_response
+from flask import Flask, render_template, request, jsonify, abort, make_response, send_from_directory
 import threading
-from concurrent.futures import ThreadPoolExecutor
+import queue
+import atexit
+import itertools
+import zlib
+import io
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
 import socket
-from functools import wraps
+from functools import wraps, lru_cache
+from contextlib import contextmanager, ExitStack
 from selenium import webdriver
 from selenium.webdriver.edge.options import Options
 from selenium.webdriver.edge.service import Service
@@ -16,12 +23,37 @@ from webdriver_manager.microsoft import EdgeChromiumDriverManager
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, JavascriptException, StaleElementReferenceException, WebDriverException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, JavascriptException, StaleElementReferenceException, WebDriverException, NoAlertPresentException, NoSuchWindowException
 from email_sender import send_email
 import pyautogui
 import webbrowser
-from datetime import datetime
-import base64
+import calendar
+from datetime import datetime, timedelta
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+try:
+    from flask_compress import Compress
+except ImportError:
+    Compress = None
+
+# Portal clicks are paced by waits on the page, not by pyautogui's built-in delays
+pyautogui.MINIMUM_DURATION = 0
+pyautogui.MINIMUM_SLEEP = 0
+pyautogui.PAUSE = 0
 
 # Configure logging
 log_file_path = os.path.join(os.getcwd(), 'validation.log')
@@ -49,14 +81,44 @@ except (FileNotFoundError, json.JSONDecodeError, KeyError) as e:
     logging.error(f"Failed to load configuration: {e}")
     raise
 
+def build_locators(tabs):
+    """Precompute each tab's link locator and the column index used by each of its sub-tabs"""
+    locators = {}
+    for tab_name, tab_data in tabs.items():
+        column_index = tab_data.get('column_index')
+        locators[tab_name] = {
+            'tab_locator': (By.XPATH, f"//a[@href='{tab_data['url']}']"),
+            'sub': {
+                sub_tab_name: column_index.get(sub_tab_name) if isinstance(column_index, dict) else column_index
+                for sub_tab_name in tab_data.get('sub_tabs', {})
+            }
+        }
+    return locators
+
+_locators = build_locators(config['tabs'])
+
+# Environment names in config order, for the home page and validation error messages
+_ENV_LIST = list(config['environments'].keys())
+
 # Create Flask app
 app = Flask(__name__)
 app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 0  # Disable caching for development
 
+# Compress text responses (/status, /logs, reports) for clients that accept gzip/br
+if Compress is not None:
+    app.config['COMPRESS_MIMETYPES'] = ['application/json', 'text/html', 'text/plain']
+    app.config['COMPRESS_LEVEL'] = 5
+    app.config['COMPRESS_MIN_SIZE'] = 500
+    Compress(app)
+
+# Upper bound on result entries kept in memory; the full history is in the log file
+RESULTS_MAXLEN = 1000
+
 # Validation state
 validation_status = {
     'status': 'Not Started', 
-    'results': [], 
+    'results': deque(maxlen=RESULTS_MAXLEN), 
+    'results_seq': 0,
     'paused': False, 
     'stopped': False,
     'start_time': None,
@@ -69,6 +131,175 @@ validation_status = {
     'screenshots': []
 }
 
+# Guards validation_status counters and results while tabs run in parallel
+status_lock = threading.RLock()
+
+# JSON encoding of each entry in validation_status['results'], produced once at append time
+_results_encoded = deque(maxlen=RESULTS_MAXLEN)
+
+# results_seq at the last reset; result indexes count up from here
+_results_base = 0
+
+# Result classes that the report and the pages know, for the other statuses results are logged with:
+# informational lines count as Success and warnings as Skipped
+RESULT_STATUS = {'Info': 'Success', 'Warning': 'Skipped'}
+
+def append_result(message, status="Info", timestamp=None):
+    """
+    Append a classified entry to the status results and advance the results cursor
+    
+    Args:
+        message: Text of the result
+        status: Status the result was logged with (Success, Failed, Skipped, Warning or Info); the
+            entry stores Success, Failed or Skipped, mapping the last two through RESULT_STATUS
+        timestamp: Time of day for the entry (defaults to now)
+    """
+    with status_lock:
+        validation_status['results_seq'] += 1
+        entry = {
+            'index': validation_status['results_seq'] - _results_base,
+            'message': message,
+            'status': RESULT_STATUS.get(status, status),
+            'timestamp': timestamp or now_str()[11:]
+        }
+        validation_status['results'].append(entry)
+        _results_encoded.append(encode_json(entry))
+
+def reset_results():
+    """Clear the status results; the cursor keeps counting so client cursors stay valid"""
+    global _results_base
+    with status_lock:
+        _results_base = validation_status['results_seq']
+        validation_status['results'] = deque(maxlen=RESULTS_MAXLEN)
+        _results_encoded.clear()
+        _status_snapshot['version'] += 1
+
+def set_status(**fields):
+    """
+    Update validation_status fields and apply the rules tied to status transitions
+    
+    Args:
+        **fields: validation_status keys and their new values
+    """
+    with status_lock:
+        validation_status.update(fields)
+        if 'status' in fields:
+            # A finished run always shows a full progress bar
+            if fields['status'] in ('Completed', 'Failed'):
+                validation_status['progress'] = 100
+            # A run that completed had no real failures, keep the pie chart consistent
+            if fields['status'] == 'Completed':
+                validation_status['failed_checks'] = 0
+        _status_snapshot['version'] += 1
+
+def mark_status_changed():
+    """Invalidate the cached /status body after an in-place change to validation_status"""
+    with status_lock:
+        _status_snapshot['version'] += 1
+
+def encode_json(data):
+    """Serialize data to JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode('utf-8')
+
+# Encoded full /status body (without the per-response timestamp) and its opaque ETag, rebuilt only
+# when the status or results change
+_status_snapshot = {'version': 0, 'key': None, 'body': b'', 'etag': ''}
+
+def etag_matches(etag):
+    """
+    True if the request's If-None-Match names etag
+    
+    Flask-Compress appends the encoding to the ETag of a compressed response (e.g. "1a2b3c4d:gzip"),
+    and browsers may send it back weak, so those forms match too
+    
+    Args:
+        etag: Opaque tag without quotes
+    """
+    return any(tag == etag or tag.startswith(etag + ':')
+               for tag in request.if_none_match.as_set(include_weak=True))
+
+def encoded_results_since(since=None):
+    """
+    Return the pre-encoded results appended after a client's cursor
+    
+    Args:
+        since: Value of results_seq the client last saw (None for all retained results)
+    
+    Returns:
+        list: JSON bytes of the new entries (all retained entries if the cursor is unknown or too old)
+    """
+    with status_lock:
+        retained = len(_results_encoded)
+        new_count = retained if since is None else validation_status['results_seq'] - since
+        if new_count < 0 or new_count >= retained:
+            return list(_results_encoded)
+        return list(itertools.islice(_results_encoded, retained - new_count, None))
+
+# Timing events are queued by the validation threads and applied in batches by one consumer
+metrics_queue = queue.SimpleQueue()
+metrics_lock = threading.Lock()
+METRICS_BATCH_SIZE = 256
+
+def _apply_metric_events(events):
+    """Fold a batch of timing events into validation_status['performance_metrics']"""
+    with metrics_lock:
+        metrics = validation_status['performance_metrics']
+        for kind, name, duration, timestamp in events:
+            if kind == 'component':
+                metrics['component_timings'].setdefault(name, []).append(duration)
+            elif kind == 'interaction':
+                metrics['interaction_timings'].append({
+                    'name': name,
+                    'duration': duration,
+                    'timestamp': timestamp
+                })
+            elif kind == 'element':
+                metrics['element_timings'].setdefault(name, []).append(duration)
+            elif kind == 'flush':
+                # Everything queued before the marker has been applied
+                name.set()
+    mark_status_changed()
+
+def _metrics_worker():
+    """Drain the metrics queue, applying up to METRICS_BATCH_SIZE events per lock acquisition"""
+    while True:
+        events = [metrics_queue.get()]
+        try:
+            while len(events) < METRICS_BATCH_SIZE:
+                events.append(metrics_queue.get_nowait())
+        except queue.Empty:
+            pass
+        try:
+            _apply_metric_events(events)
+        except Exception as e:
+            logging.warning(f"Failed to record performance metrics: {e}")
+
+def snapshot_metrics():
+    """
+    Copy validation_status['performance_metrics'] under metrics_lock so readers never iterate
+    it while the metrics worker adds to it
+    
+    Returns:
+        dict: The metrics with every timing dict and list copied
+    """
+    with metrics_lock:
+        metrics = validation_status['performance_metrics']
+        return {
+            'component_timings': {name: list(timings) for name, timings in metrics.get('component_timings', {}).items()},
+            'interaction_timings': list(metrics.get('interaction_timings', [])),
+            'element_timings': {name: list(timings) for name, timings in metrics.get('element_timings', {}).items()}
+        }
+
+def flush_metrics(timeout=5):
+    """Block until all timing events queued so far have been applied"""
+    applied = threading.Event()
+    metrics_queue.put(('flush', applied, None, None))
+    applied.wait(timeout)
+
+threading.Thread(target=_metrics_worker, name='metrics-writer', daemon=True).start()
+
 # Threading events
 pause_event = threading.Event()
 pause_event.set()
@@ -107,9 +338,39 @@ def rate_limit(func):
         return func(*args, **kwargs)
     return wrapper
 
+# Formatted wall-clock time for the current second, shared by every caller within that second
+_timestamp_cache = (0, '')
+
+def now_str():
+    """Return the current local time as 'YYYY-MM-DD HH:MM:SS', formatting at most once per second"""
+    global _timestamp_cache
+    current_second = int(time.time())
+    cached_second, cached_str = _timestamp_cache
+    if current_second != cached_second:
+        cached_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(current_second))
+        # Swap in a new tuple so concurrent readers never see a mismatched pair
+        _timestamp_cache = (current_second, cached_str)
+    return cached_str
+
+def _timestamp_seconds(timestamp):
+    """Convert a 'YYYY-MM-DD HH:MM:SS' string to seconds by fixed-position slicing"""
+    if len(timestamp) != 19:
+        raise ValueError(f"Unexpected timestamp format: {timestamp}")
+    return calendar.timegm((
+        int(timestamp[0:4]), int(timestamp[5:7]), int(timestamp[8:10]),
+        int(timestamp[11:13]), int(timestamp[14:16]), int(timestamp[17:19]),
+        0, 0, 0
+    ))
+
+@lru_cache(maxsize=None)
 def calculate_duration(start, end):
     if not start or not end:
         return 'N/A'
+    try:
+        # Both timestamps come from now_str(), so their layout is fixed
+        return str(timedelta(seconds=_timestamp_seconds(end) - _timestamp_seconds(start)))
+    except ValueError:
+        pass
     try:
         start_dt = datetime.strptime(start, '%Y-%m-%d %H:%M:%S')
         end_dt = datetime.strptime(end, '%Y-%m-%d %H:%M:%S')
@@ -118,19 +379,194 @@ def calculate_duration(start, end):
     except:
         return 'N/A'
 
-def setup_driver():
-    """Set up and configure the WebDriver with proper options"""
+# Screenshots are bucketed into one subdirectory per run, named after the run's start time
+screenshots_root = os.path.join(os.getcwd(), 'screenshots')
+
+def run_screenshot_dir(start_time=None):
+    """
+    Directory holding the screenshots of a validation run
+    
+    Args:
+        start_time: Run start as 'YYYY-MM-DD HH:MM:SS' (defaults to the current run)
+    
+    Returns:
+        str: Per-run directory, or the screenshots root before any run has started
+    """
+    start_time = start_time or validation_status.get('start_time')
+    if not start_time:
+        return screenshots_root
+    return os.path.join(screenshots_root, start_time.replace(':', '').replace(' ', '_'))
+
+def screenshot_url(screenshot_file):
+    """URL under /screenshots that serves a file stored below screenshots_root"""
+    return '/screenshots/' + os.path.relpath(screenshot_file, screenshots_root).replace(os.sep, '/')
+
+# Background writer for screenshots so disk I/O stays off the Selenium thread
+screenshot_executor = ThreadPoolExecutor(max_workers=2)
+
+def screenshot_hash(png):
+    """Fast content hash of screenshot bytes (xxhash when installed, CRC32 otherwise)"""
+    if xxhash is not None:
+        return xxhash.xxh3_64_intdigest(png)
+    return zlib.crc32(png)
+
+# Longest edge of a stored screenshot; captures are downscaled to fit before they are written
+SCREENSHOT_MAX_SIZE = (1280, 1280)
+
+def write_screenshot(png, screenshot_file):
+    """
+    Downscale and re-encode captured PNG bytes with Pillow, then write them to disk
+    
+    Args:
+        png: PNG bytes from the WebDriver
+        screenshot_file: Destination path; a .jpg extension stores a quality 70 JPEG
+    """
+    if Image is not None:
+        try:
+            image = Image.open(io.BytesIO(png))
+            image.thumbnail(SCREENSHOT_MAX_SIZE)
+            if screenshot_file.endswith('.jpg'):
+                image.convert('RGB').save(screenshot_file, format='JPEG', quality=70)
+            else:
+                image.save(screenshot_file, format='PNG', optimize=True, compress_level=6)
+            return
+        except Exception as e:
+            logging.warning(f"Failed to compress screenshot {screenshot_file}, saving it as captured: {e}")
+    
+    # Pillow missing or failed: store the capture unchanged
+    with open(screenshot_file, 'wb', buffering=1 << 16) as image_file:
+        image_file.write(png)
+
+def _persist_screenshot(name, png, screenshot_file, timestamp, png_hash, last_screenshot):
+    """
+    Write captured PNG bytes to disk and record them in the validation status
+
+    Args:
+        png_hash: screenshot_hash of png
+        last_screenshot: The run's {name: (hash, url)} of persisted screenshots; updated once the file is written
+    """
+    try:
+        write_screenshot(png, screenshot_file)
+        url = screenshot_url(screenshot_file)
+        last_screenshot[name] = (png_hash, url)
+        
+        # Keep only a link in memory; the image is served from disk on request
+        with status_lock:
+            validation_status['screenshots'].append({
+                'name': name,
+                'url': url,
+                'timestamp': timestamp
+            })
+            mark_status_changed()
+        logging.info(f"Screenshot saved: {screenshot_file}")
+    except Exception as e:
+        logging.warning(f"Failed to persist screenshot {screenshot_file}: {e}")
+
+# Cached msedgedriver location so WebDriver Manager is only consulted when needed
+driver_path_file = os.path.join(os.getcwd(), 'dist', 'edgedriver_path.txt')
+_driver_path_cache = None
+_browser_version_cache = None
+
+def _save_driver_path_cache():
+    """Persist the cached driver path and browser version for the next process start"""
+    try:
+        os.makedirs(os.path.dirname(driver_path_file), exist_ok=True)
+        with open(driver_path_file, 'w') as cache_file:
+            cache_file.write(f"{_driver_path_cache}\n{_browser_version_cache or ''}\n")
+    except OSError as e:
+        logging.warning(f"Failed to persist Edge WebDriver path: {e}")
+
+def invalidate_edge_driver_path():
+    """Forget the cached driver path so the next lookup goes through WebDriver Manager"""
+    global _driver_path_cache, _browser_version_cache
+    _driver_path_cache = None
+    _browser_version_cache = None
+    try:
+        os.remove(driver_path_file)
+    except OSError:
+        pass
+
+def get_edge_driver_path():
+    """Return the msedgedriver path, resolving it with WebDriver Manager only if the cache is missing"""
+    global _driver_path_cache, _browser_version_cache
+    
+    # Pick up the path resolved by a previous process
+    if _driver_path_cache is None and os.path.exists(driver_path_file):
+        try:
+            with open(driver_path_file) as cache_file:
+                lines = cache_file.read().splitlines()
+            _driver_path_cache = lines[0] if lines and lines[0] else None
+            _browser_version_cache = lines[1] if len(lines) > 1 and lines[1] else None
+        except OSError as e:
+            logging.warning(f"Failed to read cached Edge WebDriver path: {e}")
+    
+    if _driver_path_cache and os.path.exists(_driver_path_cache):
+        return _driver_path_cache
+    
+    _driver_path_cache = EdgeChromiumDriverManager().install()
+    _browser_version_cache = None
+    _save_driver_path_cache()
+    return _driver_path_cache
+
+def track_browser_version(driver):
+    """Record the browser version and drop the cached driver path when the browser has been updated"""
+    global _browser_version_cache
+    browser_version = driver.capabilities.get('browserVersion')
+    if not browser_version:
+        return
+    if _browser_version_cache is None:
+        _browser_version_cache = browser_version
+        _save_driver_path_cache()
+    elif browser_version != _browser_version_cache:
+        logging.info(f"Edge updated from {_browser_version_cache} to {browser_version}, re-resolving WebDriver on next start")
+        invalidate_edge_driver_path()
+
+# Resolve the driver path once at import so the first validation doesn't pay for it;
+# if this fails (e.g. offline), setup_driver resolves it again on demand
+try:
+    get_edge_driver_path()
+except Exception as e:
+    logging.warning(f"Could not resolve Edge WebDriver path at startup: {e}")
+
+def setup_driver(headless=False):
+    """
+    Set up and configure the WebDriver with proper options
+    
+    Args:
+        headless: Run without a browser window (no compositing or window management)
+    """
     options = Options()
-    options.add_argument("--start-maximized")  # Start maximized
+    if headless:
+        options.add_argument("--headless=new")  # No visible window
+        options.add_argument("--disable-gpu")  # No compositor work
+        options.add_argument("--disable-dev-shm-usage")  # Avoid small /dev/shm crashes
+        options.add_argument("--blink-settings=imagesEnabled=false")  # Skip image decoding
+        options.add_argument("--window-size=1920,1080")  # Maximizing has no effect headless
+    else:
+        options.add_argument("--start-maximized")  # Start maximized
     options.add_argument("--disable-extensions")  # Disable extensions
     options.add_argument("--disable-popup-blocking")  # Disable popup blocking
     options.add_argument("--disable-infobars")  # Disable infobars
-    options.page_load_strategy = 'normal'  # Wait for full page load
+    options.add_experimental_option('prefs', {
+        'profile.managed_default_content_settings.images': 2,  # Validation never inspects images
+        'profile.default_content_setting_values.notifications': 2  # No notification prompts
+    })
+    options.page_load_strategy = 'eager'  # Return at DOMContentLoaded, not after every subresource
     
     try:
-        # Use WebDriver Manager to automatically download and manage the correct Edge WebDriver
-        service = Service(EdgeChromiumDriverManager().install())
-        driver = webdriver.Edge(service=service, options=options)
+        # Reuse the cached driver path; WebDriver Manager is only consulted when it is missing
+        had_cached_path = _driver_path_cache is not None or os.path.exists(driver_path_file)
+        try:
+            service = Service(get_edge_driver_path())
+            driver = webdriver.Edge(service=service, options=options)
+        except WebDriverException:
+            if not had_cached_path:
+                raise
+            # A stale cached driver no longer matches the browser, resolve it again
+            invalidate_edge_driver_path()
+            service = Service(get_edge_driver_path())
+            driver = webdriver.Edge(service=service, options=options)
+        track_browser_version(driver)
         logging.info("Using WebDriver Manager for automatic Edge WebDriver management")
     except Exception as e:
         logging.warning(f"Failed to use WebDriver Manager: {e}")
@@ -146,11 +582,169 @@ def setup_driver():
             driver = webdriver.Edge(options=options)
             logging.info("Using system PATH for Edge WebDriver")
     
-    driver.set_page_load_timeout(30)
-    driver.set_script_timeout(30)
+    # Timeouts are set once per driver; every wait in the validation is an explicit WebDriverWait
+    driver.set_page_load_timeout(15)
+    driver.set_script_timeout(10)
+    driver.implicitly_wait(0)
     
     return driver
 
+# Seconds a checkout waits for another run to return a driver before giving up
+DRIVER_CHECKOUT_TIMEOUT = 60
+
+class WebDriverPool:
+    """Bounded pool of warm WebDriver instances reused across validation runs"""
+    
+    def __init__(self, max_size=2, headless=False):
+        self.max_size = max_size
+        self.headless = headless
+        self._idle = queue.Queue(maxsize=max_size)
+        self._created = 0
+        self._lock = threading.Lock()
+    
+    def _acquire(self, timeout):
+        """Take an idle driver, or start a new one if the pool is not at capacity"""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        
+        with self._lock:
+            can_create = self._created < self.max_size
+            if can_create:
+                self._created += 1
+        
+        if not can_create:
+            try:
+                return self._idle.get(timeout=timeout)
+            except queue.Empty:
+                raise TimeoutError(f"No WebDriver was returned to the pool within {timeout}s") from None
+        
+        try:
+            return setup_driver(headless=self.headless)
+        except Exception:
+            with self._lock:
+                self._created -= 1
+            raise
+    
+    @contextmanager
+    def checkout(self, timeout=DRIVER_CHECKOUT_TIMEOUT):
+        """
+        Borrow a driver for the duration of a with block
+        
+        The driver goes back to the pool however the block exits; a WebDriverException
+        escaping the block may mean a dead session, so that driver is quit instead.
+        
+        Args:
+            timeout: Seconds to wait for a driver to be checked in when the pool is exhausted
+        
+        Yields:
+            WebDriver instance
+        
+        Raises:
+            TimeoutError: If no driver became free within the timeout
+        """
+        driver = self._acquire(timeout)
+        healthy = True
+        try:
+            yield driver
+        except WebDriverException:
+            healthy = False
+            raise
+        finally:
+            if healthy:
+                self.checkin(driver)
+            else:
+                self.discard(driver)
+    
+    def checkin(self, driver):
+        """Reset a driver's session state and return it to the pool"""
+        try:
+            driver.delete_all_cookies()
+            driver.get('about:blank')
+        except Exception as e:
+            logging.warning(f"Discarding WebDriver that failed to reset: {e}")
+            self.discard(driver)
+            return
+        
+        try:
+            self._idle.put_nowait(driver)
+        except queue.Full:
+            self.discard(driver)
+    
+    def discard(self, driver):
+        """Quit a driver and free its slot in the pool"""
+        with self._lock:
+            self._created -= 1
+        try:
+            driver.quit()
+        except Exception as e:
+            logging.warning(f"Error while closing WebDriver: {e}")
+    
+    def close_all(self):
+        """Quit every idle driver in the pool"""
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self.discard(driver)
+
+# Validation only reads the DOM, so its drivers run headless unless the config says otherwise
+driver_pool = WebDriverPool(max_size=config.get('driver_pool_size', 2), headless=config.get('headless', True))
+atexit.register(driver_pool.close_all)
+
+# Returns [row_count, link in the first data row's column (or null)] for the list table
+FIRST_LIST_ELEMENT_JS = """
+var rows = document.querySelectorAll("table.ListView > tbody > tr");
+if (rows.length <= 1) return [rows.length, null];
+var cell = rows[1].querySelectorAll(":scope > td")[arguments[0] - 1];
+return [rows.length, cell ? cell.querySelector("a") : null];
+"""
+
+# Runs a sub-tab script preloaded into window.__subtabs, then polls until its content is visible.
+# Reports 'ready', 'timeout', 'missing' (scripts not loaded on this page) or 'error:<message>'
+ACTIVATE_SUB_TAB_JS = """
+var name = arguments[0], selector = arguments[1], byId = arguments[2], timeoutMs = arguments[3];
+var done = arguments[arguments.length - 1];
+if (!window.__subtabs || !(name in window.__subtabs)) { done('missing'); return; }
+try {
+    (new Function(window.__subtabs[name]))();
+} catch (e) {
+    done('error:' + e.message);
+    return;
+}
+if (!selector) { done('ready'); return; }
+var deadline = Date.now() + timeoutMs;
+(function poll() {
+    var el = byId ? document.getElementById(selector) : document.querySelector(selector);
+    if (el && (el.offsetWidth || el.offsetHeight || el.getClientRects().length)) { done('ready'); return; }
+    if (Date.now() > deadline) { done('timeout'); return; }
+    setTimeout(poll, 100);
+})();
+"""
+
+def page_is_ready(driver):
+    """True once the DOM is parsed; with the eager load strategy images and other subresources may still be loading"""
+    return driver.execute_script('return document.readyState') in ('interactive', 'complete')
+
+def wait_for_page_ready(driver, timeout=2, locator=None):
+    """
+    Wait up to timeout seconds for the DOM to be ready
+    
+    Args:
+        driver: WebDriver instance
+        timeout: Ceiling in seconds for both checks together; returns as soon as the page settles
+        locator: Optional (By, value) tuple that must also be present
+    """
+    def settled(d):
+        return page_is_ready(d) and (locator is None or bool(d.find_elements(*locator)))
+    
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.1).until(settled)
+    except TimeoutException:
+        pass
+
 def find_element_with_retry(driver, by, value, max_attempts=3, wait_time=5, condition=EC.presence_of_element_located):
     """
     Find an element with retry logic to handle stale element references
@@ -159,38 +753,24 @@ def find_element_with_retry(driver, by, value, max_attempts=3, wait_time=5, cond
         driver: WebDriver instance
         by: By locator type
         value: Locator value
-        max_attempts: Maximum number of retry attempts
-        wait_time: Wait time in seconds
+        max_attempts: Number of wait_time periods to keep polling for
+        wait_time: Wait time in seconds per attempt
         condition: Expected condition to wait for (default: presence_of_element_located)
     
     Returns:
-        WebElement if found, None otherwise
+        WebElement once the condition is met; raises TimeoutException otherwise
     """
-    attempt = 0
-    last_exception = None
-    
-    while attempt < max_attempts:
-        try:
-            element = WebDriverWait(driver, wait_time).until(
-                condition((by, value))
-            )
-            return element
-        except (StaleElementReferenceException, TimeoutException, NoSuchElementException) as e:
-            attempt += 1
-            last_exception = e
-            if attempt == max_attempts:
-                logging.warning(f"Failed to find element after {max_attempts} attempts: {by}={value}, Error: {e}")
-                if isinstance(e, StaleElementReferenceException):
-                    # On stale element, try to refresh the page as last resort
-                    try:
-                        driver.refresh()
-                        time.sleep(2)
-                    except:
-                        pass
-                raise last_exception
-            time.sleep(1)  # Short delay before retry
-    
-    return None
+    # One wait covering all attempts; stale/missing elements are simply polled again
+    try:
+        return WebDriverWait(
+            driver,
+            max_attempts * wait_time,
+            poll_frequency=0.2,
+            ignored_exceptions=(StaleElementReferenceException, NoSuchElementException)
+        ).until(condition((by, value)))
+    except TimeoutException as e:
+        logging.warning(f"Failed to find element within {max_attempts * wait_time}s: {by}={value}, Error: {e}")
+        raise
 
 def click_element_with_retry(element, max_attempts=3):
     """
@@ -210,7 +790,8 @@ def click_element_with_retry(element, max_attempts=3):
             try:
                 driver = element._parent
                 driver.execute_script("arguments[0].scrollIntoView(true);", element)
-                time.sleep(0.5)  # Short delay after scrolling
+                # Proceed as soon as the element is clickable after scrolling
+                WebDriverWait(driver, 2).until(EC.element_to_be_clickable(element))
             except:
                 pass
                 
@@ -254,27 +835,32 @@ def validate_application(environment, validation_portal_link=None, retry_failed=
     """
     global validation_status
     
-    # Initialize performance metrics
-    validation_status['performance_metrics'] = {
-        'component_timings': {},
-        'interaction_timings': [],
-        'element_timings': {}
-    }
+    # Initialize performance metrics once any events from a previous run have landed
+    flush_metrics()
+    with metrics_lock:
+        validation_status['performance_metrics'] = {
+            'component_timings': {},
+            'interaction_timings': [],
+            'element_timings': {}
+        }
     
-    # Update validation status
-    validation_status['status'] = 'Running'
-    validation_status['environment'] = environment
-    validation_status['start_time'] = time.strftime("%Y-%m-%d %H:%M:%S")
-    validation_status['end_time'] = None
-    validation_status['successful_checks'] = 0
-    validation_status['failed_checks'] = 0
-    validation_status['skipped_checks'] = 0
-    validation_status['progress'] = 0  # Initialize progress at 0%
-    validation_status['screenshots'] = []
+    # Update validation status; the summary times the run from the monotonic clock
+    run_started = time.monotonic()
+    set_status(
+        status='Running',
+        environment=environment,
+        start_time=now_str(),
+        end_time=None,
+        successful_checks=0,
+        failed_checks=0,
+        skipped_checks=0,
+        progress=0,  # Initialize progress at 0%
+        screenshots=[]
+    )
     
     # Track previous failed checks for retry
     previous_results = validation_status['results'] if retry_failed else []
-    validation_status['results'] = []
+    reset_results()
     
     # Track failed tabs for retry
     failed_tabs = []
@@ -283,30 +869,47 @@ def validate_application(environment, validation_portal_link=None, retry_failed=
     try:
         url = config['environments'].get(environment)
         if not url:
-            raise ValueError(f"Invalid environment selected: {environment}. Please choose from: {', '.join(config['environments'].keys())}")
+            raise ValueError(f"Invalid environment selected: {environment}. Please choose from: {', '.join(_ENV_LIST)}")
     except Exception as e:
         error_msg = f"Error setting URL for environment {environment}: {e}"
         logging.error(error_msg)
-        validation_status['results'].append(error_msg)
-        validation_status['status'] = 'Failed'
-        validation_status['progress'] = 100  # Mark as complete even for failures
+        append_result(error_msg, "Failed")
+        set_status(status='Failed')  # Marks progress complete even for failures
         return [], False
 
     logging.info(f"Selected environment: {environment}")
-    validation_status['results'].append(f"Selected environment: {environment}")
+    append_result(f"Selected environment: {environment}")
     
-    # Setup WebDriver with improved options
+    # Setup WebDriver with improved options; the pool takes it back however the run ends
+    driver = None
     try:
-        driver = setup_driver()
-        logging.info("WebDriver initialized successfully")
+        with driver_pool.checkout() as driver:
+            logging.info("WebDriver checked out from pool successfully")
+            return _validate_with_driver(driver, environment, url, validation_portal_link, run_started)
     except Exception as e:
+        if driver is not None:
+            raise
         error_msg = f"Failed to initialize WebDriver: {e}"
         logging.error(error_msg)
-        validation_status['results'].append(error_msg)
-        validation_status['status'] = 'Failed'
-        validation_status['progress'] = 100  # Mark as complete even for failures
+        append_result(error_msg, "Failed")
+        set_status(status='Failed')  # Marks progress complete even for failures
         return [], False
+
+
+def _validate_with_driver(driver, environment, url, validation_portal_link, run_started):
+    """
+    Validate every configured tab on a driver checked out by validate_application
+    
+    Args:
+        driver: WebDriver borrowed from driver_pool; the caller returns it
+        environment: Environment being validated
+        url: Application URL for the environment
+        validation_portal_link: Link to validation portal (optional)
+        run_started: time.monotonic() at the start of the run
     
+    Returns:
+        tuple: (validation_results, success)
+    """
     validation_results = []
 
     def log_and_update_status(message, status="Success"):
@@ -315,22 +918,13 @@ def validate_application(environment, validation_portal_link=None, retry_failed=
         
         Args:
             message: Message to log
-            status: Status of the check (Success, Failed, Skipped)
+            status: Status of the check (Success, Failed, Skipped, Warning or Info); only the first
+                three are counted, and results store Warning as Skipped and Info as Success
         """
-        # Update counters
-        if status == "Success":
-            validation_status['successful_checks'] += 1
-        elif status == "Failed":
-            validation_status['failed_checks'] += 1
-        elif status == "Skipped":
-            validation_status['skipped_checks'] += 1
-        
-        # Format message with timestamp
-        timestamp = time.strftime("%H:%M:%S")
-        formatted_message = f"[{timestamp}] [{status}] {message}"
+        # Classify once here so the report never has to parse result strings
+        timestamp = now_str()[11:]
         
-        # Log to console and file
-        print(formatted_message)
+        # Log to file and console (console_handler already echoes every record)
         if status == "Success":
             logging.info(message)
         elif status == "Failed":
@@ -338,72 +932,87 @@ def validate_application(environment, validation_portal_link=None, retry_failed=
         else:
             logging.warning(message)
             
-        # Add to results
-        validation_results.append((message, status))
-        validation_status['results'].append(formatted_message)
+        # Update counters and results together so parallel tab workers don't lose increments
+        with status_lock:
+            if status == "Success":
+                validation_status['successful_checks'] += 1
+            elif status == "Failed":
+                validation_status['failed_checks'] += 1
+            elif status == "Skipped":
+                validation_status['skipped_checks'] += 1
+            validation_results.append((message, status))
+            append_result(message, status, timestamp)
     
     def record_component_timing(component_name, start_time, end_time=None):
         """Record timing for a component"""
         duration = (end_time or time.time()) - start_time
-        if component_name not in validation_status['performance_metrics']['component_timings']:
-            validation_status['performance_metrics']['component_timings'][component_name] = []
-        validation_status['performance_metrics']['component_timings'][component_name].append(duration)
+        metrics_queue.put(('component', component_name, duration, None))
         return duration
     
     def record_interaction(interaction_name, start_time, end_time=None):
         """Record timing for an interaction"""
         duration = (end_time or time.time()) - start_time
-        validation_status['performance_metrics']['interaction_timings'].append({
-            'name': interaction_name,
-            'duration': duration,
-            'timestamp': time.strftime("%Y-%m-%d %H:%M:%S")
-        })
+        metrics_queue.put(('interaction', interaction_name, duration, now_str()))
         return duration
     
     def record_element_timing(element_name, duration):
         """Record timing for element interaction"""
-        if element_name not in validation_status['performance_metrics']['element_timings']:
-            validation_status['performance_metrics']['element_timings'][element_name] = []
-        validation_status['performance_metrics']['element_timings'][element_name].append(duration)
+        metrics_queue.put(('element', element_name, duration, None))
     
-    def highlight(element):
+    def highlight(driver, element):
         try:
             driver.execute_script("arguments[0].setAttribute('style', arguments[1]);", element, "background: yellow; border: 2px solid red;")
         except StaleElementReferenceException:
             # If element is stale, we'll just skip highlighting and continue
             pass
     
-    def capture_screenshot(name):
-        """Capture and store a screenshot"""
+    # Screenshot writes still in flight on screenshot_executor; drained before the summary
+    pending_screenshots = []
+    
+    # (hash, url) of the last screenshot this run persisted under each name, used to skip unchanged
+    # captures; only written screenshots are recorded, so a failed write is never pointed at
+    last_screenshot = {}
+    
+    def capture_screenshot(driver, name):
+        """Capture a screenshot and hand it off for background persistence"""
         try:
-            screenshot_path = os.path.join(os.getcwd(), 'screenshots')
+            screenshot_path = run_screenshot_dir()
             os.makedirs(screenshot_path, exist_ok=True)
             screenshot_file = os.path.join(screenshot_path, f"{name}_{time.strftime('%Y%m%d_%H%M%S')}.png")
-            driver.save_screenshot(screenshot_file)
             
-            # Store screenshot data in validation status
-            with open(screenshot_file, "rb") as image_file:
-                encoded_string = base64.b64encode(image_file.read()).decode('utf-8')
-                validation_status['screenshots'].append({
-                    'name': name,
-                    'data': f"data:image/png;base64,{encoded_string}",
-                    'timestamp': time.strftime("%Y-%m-%d %H:%M:%S")
-                })
+            # Grabbing the PNG must happen on the Selenium thread; the write and encode do not
+            png = driver.get_screenshot_as_png()
             
-            logging.info(f"Screenshot saved: {screenshot_file}")
+            # Nothing changed on screen since the last capture with this name: point at that file
+            png_hash = screenshot_hash(png)
+            previous = last_screenshot.get(name)
+            if previous and previous[0] == png_hash:
+                with status_lock:
+                    validation_status['screenshots'].append({
+                        'name': name,
+                        'url': previous[1],
+                        'timestamp': now_str()
+                    })
+                    mark_status_changed()
+                return True
+            
+            pending_screenshots.append(
+                screenshot_executor.submit(
+                    _persist_screenshot, name, png, screenshot_file, now_str(), png_hash, last_screenshot
+                )
+            )
             return True
         except Exception as e:
             logging.warning(f"Failed to capture screenshot: {e}")
             return False
     
-    def check_tab(tab_element, tab_name, content_locator, index):
+    def check_tab(driver, tab_element, tab_name, content_locator, index):
         pause_event.wait()
         if stop_event.is_set():
             return False
 
         try:
-            highlight(tab_element)
-            time.sleep(1)
+            highlight(driver, tab_element)
             
             # Record timing for tab interaction
             tab_start = time.time()
@@ -444,29 +1053,68 @@ def validate_application(environment, validation_portal_link=None, retry_failed=
             record_interaction(f"Tab {tab_name} load", tab_start)
             return False
     
-    def check_sub_tab(sub_tab_js, sub_tab_name, content_locator, main_index, sub_index):
+    def preload_sub_tabs(driver, tab_name, sub_tab_scripts):
+        """Ship every sub-tab script to the page once; each activation then only sends its name"""
+        try:
+            driver.execute_script("window.__subtabs = arguments[0];", sub_tab_scripts)
+        except WebDriverException as e:
+            logging.warning(f"Failed to preload sub-tab scripts for '{tab_name}': {e}")
+    
+    def check_sub_tab(driver, tab_name, sub_tab_scripts, sub_tab_name, content_locator, main_index, sub_index):
         pause_event.wait()
         if stop_event.is_set():
             return False
 
         try:
-            time.sleep(1)
             # Record timing for sub-tab interaction
             sub_tab_start = time.time()
             
-            # Execute the JavaScript to navigate to the sub-tab
-            driver.execute_script(sub_tab_js)
-            
-            # Verify that the expected content appears
             locator_type = content_locator['type']
             locator_value = content_locator['value']
             
-            try:
-                if locator_type == 'css':
-                    WebDriverWait(driver, 5).until(EC.visibility_of_element_located((By.CSS_SELECTOR, locator_value)))
-                elif locator_type == 'id':
-                    WebDriverWait(driver, 5).until(EC.visibility_of_element_located((By.ID, locator_value)))
-            except (TimeoutException, NoSuchElementException):
+            def activate():
+                """Run the preloaded sub-tab script and poll for its content in a single async call"""
+                try:
+                    return driver.execute_async_script(
+                        ACTIVATE_SUB_TAB_JS,
+                        sub_tab_name,
+                        locator_value if locator_type in ('css', 'id') else None,
+                        locator_type == 'id',
+                        5000
+                    )
+                except JavascriptException as e:
+                    # The script navigated away from the page before it could report back; Edge reports
+                    # that as a JavaScript error. Any other failure is reported as one below.
+                    if 'document unloaded' not in (e.msg or ''):
+                        raise
+                    return 'navigated'
+            
+            outcome = activate()
+            if outcome == 'missing':
+                # A page reload dropped the preloaded scripts: ship them again so this sub-tab and
+                # the remaining ones take the single-call path
+                preload_sub_tabs(driver, tab_name, sub_tab_scripts)
+                outcome = activate()
+            
+            if outcome.startswith('error:'):
+                raise JavascriptException(outcome[len('error:'):])
+            
+            if outcome == 'missing':
+                # The scripts could not be preloaded again, send this one directly
+                driver.execute_script(sub_tab_scripts[sub_tab_name])
+            
+            if outcome in ('missing', 'navigated'):
+                # Verify that the expected content appears
+                try:
+                    if locator_type == 'css':
+                        WebDriverWait(driver, 5).until(EC.visibility_of_element_located((By.CSS_SELECTOR, locator_value)))
+                    elif locator_type == 'id':
+                        WebDriverWait(driver, 5).until(EC.visibility_of_element_located((By.ID, locator_value)))
+                    outcome = 'ready'
+                except (TimeoutException, NoSuchElementException):
+                    outcome = 'timeout'
+            
+            if outcome != 'ready':
                 result = f"{main_index}.{chr(96 + sub_index)}. Sub Tab '{sub_tab_name}' was activated but expected content did not appear."
                 log_and_update_status(result, "Failed")
                 record_interaction(f"Sub-tab {sub_tab_name} load", sub_tab_start)
@@ -496,7 +1144,7 @@ def validate_application(environment, validation_portal_link=None, retry_failed=
             record_interaction(f"Sub-tab {sub_tab_name} load", sub_tab_start)
             return False
     
-    def validate_first_list_element_and_cancel(column_index, main_index, sub_index, is_export_control=False):
+    def validate_first_list_element_and_cancel(driver, column_index, main_index, sub_index, is_export_control=False):
         pause_event.wait()
         if stop_event.is_set():
             return False
@@ -508,114 +1156,83 @@ def validate_application(environment, validation_portal_link=None, retry_failed=
             # Use a longer wait time to ensure the table is fully loaded
             WebDriverWait(driver, 5).until(EC.visibility_of_element_located((By.CSS_SELECTOR, "table.ListView")))
             
-            # Try to find rows with retry logic
-            max_attempts = 3
-            attempt = 0
-            rows = []
-            
-            while attempt < max_attempts:
-                try:
-                    rows = driver.find_elements(By.XPATH, f"//table[@class='ListView']/tbody/tr")
-                    break
-                except StaleElementReferenceException:
-                    attempt += 1
-                    if attempt == max_attempts:
-                        raise
-                    time.sleep(1)
+            # Count the rows and locate the first row's link in a single round-trip
+            row_count, first_element = driver.execute_script(FIRST_LIST_ELEMENT_JS, column_index)
             
-            if len(rows) <= 1:
+            if row_count <= 1:
                 result = f"{main_index}.{chr(96 + sub_index)}. There is no data in the sub tab '{sub_index}' to check so skipping."
                 log_and_update_status(result, "Skipped")
                 record_interaction("List validation (no data)", list_start)
                 return True
 
             try:
-                # Try to find the first element - but don't treat absence as an error
-                first_element = None
-                try:
-                    first_element = find_element_with_retry(
-                        driver, 
-                        By.XPATH, 
-                        f"//table[@class='ListView']/tbody/tr[2]/td[{column_index}]/a",
-                        max_attempts=2,  # Fewer attempts since we're handling absence gracefully
-                        wait_time=3
-                    )
-                except (TimeoutException, NoSuchElementException):
-                    # No element found - this is a valid case, not an error
+                # No link in the first row is a valid case, not an error
+                if first_element is None:
                     result = f"{main_index}.{chr(96 + sub_index)}. No clickable element found in column {column_index} of the first row - skipping."
                     log_and_update_status(result, "Skipped")
                     record_interaction("List validation (no element)", list_start)
                     return True
                 
-                # If we found an element, try to click it
-                if first_element:
-                    highlight(first_element)
-                    time.sleep(1)
-                    
-                    # Record element interaction timing
-                    element_start = time.time()
-                    
-                    # Click with retry
-                    if not click_element_with_retry(first_element):
-                        result = f"{main_index}.{chr(96 + sub_index)}. Failed to click first element - element became stale. Skipping."
-                        log_and_update_status(result, "Skipped")
-                        record_interaction("List element click", element_start)
-                        return True
-                    
-                    element_duration = time.time() - element_start
-                    record_element_timing("List element click", element_duration)
-                    
-                    WebDriverWait(driver, 5).until(EC.visibility_of_element_located((By.CSS_SELECTOR, "div#content")))
-                    time.sleep(1)
+                # Click the first row's link
+                highlight(driver, first_element)
+                
+                # Record element interaction timing
+                element_start = time.time()
+                
+                # Click with retry
+                if not click_element_with_retry(first_element):
+                    result = f"{main_index}.{chr(96 + sub_index)}. Failed to click first element - element became stale. Skipping."
+                    log_and_update_status(result, "Skipped")
+                    record_interaction("List element click", element_start)
+                    return True
+                
+                element_duration = time.time() - element_start
+                record_element_timing("List element click", element_duration)
+                
+                WebDriverWait(driver, 5).until(EC.visibility_of_element_located((By.CSS_SELECTOR, "div#content")))
 
-                    # Find cancel button
-                    cancel_xpath = "//img[@src='/fpa/images/btn_cancel.jpg']" if is_export_control else "//img[@src='/fpa/images/btn_cancel.gif']"
+                # Find cancel button
+                cancel_xpath = "//img[@src='/fpa/images/btn_cancel.jpg']" if is_export_control else "//img[@src='/fpa/images/btn_cancel.gif']"
+                
+                try:
+                    cancel_button = find_element_with_retry(
+                        driver,
+                        By.XPATH,
+                        cancel_xpath,
+                        max_attempts=2
+                    )
                     
-                    try:
-                        cancel_button = find_element_with_retry(
-                            driver,
-                            By.XPATH,
-                            cancel_xpath,
-                            max_attempts=2
-                        )
-                        
-                        highlight(cancel_button)
-                        time.sleep(1)
-                        
-                        # Click cancel with retry
-                        if not click_element_with_retry(cancel_button):
-                            result = f"{main_index}.{chr(96 + sub_index)}. Failed to click cancel button - element became stale. Attempting to navigate back."
-                            log_and_update_status(result, "Warning")
-                            # Try to go back as a fallback
-                            try:
-                                driver.back()
-                                time.sleep(2)
-                            except:
-                                pass
-                            record_interaction("List validation complete", list_start)
-                            return True
-                    except (TimeoutException, NoSuchElementException):
-                        result = f"{main_index}.{chr(96 + sub_index)}. Cancel button not found. Attempting to navigate back."
+                    highlight(driver, cancel_button)
+                    
+                    # Click cancel with retry
+                    if not click_element_with_retry(cancel_button):
+                        result = f"{main_index}.{chr(96 + sub_index)}. Failed to click cancel button - element became stale. Attempting to navigate back."
                         log_and_update_status(result, "Warning")
                         # Try to go back as a fallback
                         try:
                             driver.back()
-                            time.sleep(2)
+                            wait_for_page_ready(driver)
                         except:
                             pass
                         record_interaction("List validation complete", list_start)
                         return True
-
-                    # Record successful list validation
-                    list_duration = record_interaction("List validation complete", list_start)
-                    result = f"{main_index}.{chr(96 + sub_index)}. List validation completed in {list_duration:.2f}s."
-                    log_and_update_status(result)
-                    return True
-                else:
-                    result = f"{main_index}.{chr(96 + sub_index)}. No clickable element found in first row - skipping."
-                    log_and_update_status(result, "Skipped")
-                    record_interaction("List validation (no element)", list_start)
+                except (TimeoutException, NoSuchElementException):
+                    result = f"{main_index}.{chr(96 + sub_index)}. Cancel button not found. Attempting to navigate back."
+                    log_and_update_status(result, "Warning")
+                    # Try to go back as a fallback
+                    try:
+                        driver.back()
+                        wait_for_page_ready(driver)
+                    except:
+                        pass
+                    record_interaction("List validation complete", list_start)
                     return True
+
+                # Record successful list validation
+                list_duration = record_interaction("List validation complete", list_start)
+                result = f"{main_index}.{chr(96 + sub_index)}. List validation completed in {list_duration:.2f}s."
+                log_and_update_status(result)
+                return True
                     
             except Exception as e:
                 # General exception handler for any other issues - log as a warning and continue
@@ -643,9 +1260,6 @@ def validate_application(environment, validation_portal_link=None, retry_failed=
             record_interaction("List validation (error)", list_start)
             return True
 
-    # Set page load timeout
-    driver.set_page_load_timeout(30)
-    
     # Implement exception handling with cleanup
     try:
         # Safely navigate to URL with retry logic
@@ -657,11 +1271,11 @@ def validate_application(environment, validation_portal_link=None, retry_failed=
             try:
                 nav_start = time.time()
                 driver.get(url)
-                WebDriverWait(driver, 10).until(lambda d: d.execute_script('return document.readyState') == 'complete')
+                WebDriverWait(driver, 10).until(page_is_ready)
                 nav_duration = time.time() - nav_start
                 record_component_timing("Page load", nav_start)
                 logging.info(f"Successfully navigated to {url} in {nav_duration:.2f}s")
-                validation_status['results'].append(f"Successfully navigated to {url} in {nav_duration:.2f}s")
+                append_result(f"Successfully navigated to {url} in {nav_duration:.2f}s")
                 navigation_success = True
             except (WebDriverException, TimeoutException) as e:
                 navigation_attempts += 1
@@ -674,55 +1288,51 @@ def validate_application(environment, validation_portal_link=None, retry_failed=
             raise TimeoutException(f"Failed to navigate to {url} after {max_navigation_attempts} attempts")
         
         # Capture initial screenshot
-        capture_screenshot(f"{environment}_login")
+        capture_screenshot(driver, f"{environment}_login")
 
     except Exception as e:
         error_msg = f"Failed to navigate to {url}: {e}"
         logging.error(error_msg)
         logging.error(traceback.format_exc())
-        validation_status['results'].append(error_msg)
-        driver.quit()
-        validation_status['status'] = 'Failed'
-        validation_status['end_time'] = time.strftime("%Y-%m-%d %H:%M:%S")
+        append_result(error_msg, "Failed")
+        set_status(status='Failed', end_time=now_str())
         return validation_results, False
 
-    all_tabs_opened = True
-
-    def handle_sub_tabs(tab_name, sub_tabs, main_index):
-        nonlocal all_tabs_opened
+    def handle_sub_tabs(driver, tab_name, sub_tabs, main_index):
         sub_tab_results = []
+        sub_tabs_ok = True
+        
+        sub_tab_scripts = {sub_tab_name: sub_tab_data['script'] for sub_tab_name, sub_tab_data in sub_tabs.items()}
+        preload_sub_tabs(driver, tab_name, sub_tab_scripts)
         
         for sub_index, (sub_tab_name, sub_tab_data) in enumerate(sub_tabs.items(), start=1):
             # First check if we should stop or pause
             if stop_event.is_set():
-                return sub_tab_results
+                return sub_tab_results, sub_tabs_ok
                 
             pause_event.wait()
             
             # Try to open the sub-tab
-            sub_success = check_sub_tab(sub_tab_data['script'], sub_tab_name, sub_tab_data['content_locator'], main_index, sub_index)
+            sub_success = check_sub_tab(driver, tab_name, sub_tab_scripts, sub_tab_name, sub_tab_data['content_locator'], main_index, sub_index)
             is_export_control = tab_name == "Positive Pay" and sub_tab_name == "Export Control"
             
             if sub_success:
                 # If sub-tab opened successfully, check if we need to validate the first list element
-                column_index = config['tabs'][tab_name]['column_index']
-                if isinstance(column_index, dict):
-                    column_index = column_index.get(sub_tab_name)
-                    
+                column_index = _locators[tab_name]['sub'][sub_tab_name]
                 if column_index is not None:
                     # Try to validate the first list element
-                    first_list_element_success = validate_first_list_element_and_cancel(column_index, main_index, sub_index, is_export_control=is_export_control)
+                    first_list_element_success = validate_first_list_element_and_cancel(driver, column_index, main_index, sub_index, is_export_control=is_export_control)
                     
                     # Only mark the tab as failing if an actual error occurred (not skips)
                     if not first_list_element_success:
-                        all_tabs_opened = False
+                        sub_tabs_ok = False
                 else:
                     # No column index means we skip element validation
                     result = f"{main_index}.{chr(96 + sub_index)}. No column index specified for '{sub_tab_name}' - skipping element check."
                     log_and_update_status(result, "Skipped")
             else:
                 # Sub-tab couldn't be opened - this is a failure
-                all_tabs_opened = False
+                sub_tabs_ok = False
 
             # Record the sub-tab result for reporting
             if sub_success:
@@ -732,70 +1342,144 @@ def validate_application(environment, validation_portal_link=None, retry_failed=
                 result = f"{main_index}.{chr(96 + sub_index)}. Sub Tab '{sub_tab_name}' validation failed."
                 sub_tab_results.append((result, "Failed"))
 
-        return sub_tab_results
+        return sub_tab_results, sub_tabs_ok
 
-    # Loop through all tabs
-    all_tabs_opened = True
     total_tabs = len(config['tabs'])
     tabs_processed = 0
-
-    for i, (tab_name, tab_data) in enumerate(config['tabs'].items(), start=1):
-        try:
-            # Check for stop or pause
-            if stop_event.is_set():
-                break
-                
-            pause_event.wait()
+    
+    # Drivers available to tab workers; each worker borrows one for the duration of a tab
+    tab_drivers = queue.Queue()
+    tab_drivers.put(driver)
+    extra_drivers = []
+    
+    def clone_session(cookies, leases):
+        """Check out another pooled driver into leases and replay the primary session's cookies on it"""
+        with ExitStack() as lease:
+            try:
+                worker_driver = lease.enter_context(driver_pool.checkout(timeout=1))
+            except TimeoutError:
+                return None
+            try:
+                worker_driver.get(url)
+                for cookie in cookies:
+                    try:
+                        worker_driver.add_cookie(cookie)
+                    except WebDriverException:
+                        # Cookies for other domains (e.g. SSO) can't be replayed here
+                        pass
+                worker_driver.get(url)
+                WebDriverWait(worker_driver, 10).until(page_is_ready)
+            except Exception as e:
+                # Leaving the with block gives the driver back
+                logging.warning(f"Failed to replicate session on additional WebDriver: {e}")
+                return None
+            leases.enter_context(lease.pop_all())
+            return worker_driver
+    
+    def handle_tab(tab_name, tab_data, i, next_tab_name=None):
+        """
+        Validate one main tab and its sub-tabs on a borrowed driver
+        
+        Returns:
+            tuple: (tab_ok, sub_tab_results)
+        """
+        nonlocal tabs_processed
+        
+        # Check for stop or pause
+        if stop_event.is_set():
+            return True, []
             
+        pause_event.wait()
+        
+        driver = tab_drivers.get()
+        try:
             # Update progress
-            tabs_processed += 1
-            validation_status['progress'] = int((tabs_processed / total_tabs) * 100)
+            with status_lock:
+                tabs_processed += 1
+                set_status(progress=int((tabs_processed / total_tabs) * 100))
             logging.info(f"Processing tab {i}/{total_tabs}: {tab_name} - Progress: {validation_status['progress']}%")
             
             # Try to find the tab element
             try:
                 tab_element = find_element_with_retry(
                     driver, 
-                    By.XPATH, 
-                    f"//a[@href='{tab_data['url']}']",
+                    *_locators[tab_name]['tab_locator'],
                     max_attempts=3, 
                     wait_time=5
                 )
                 
-                highlight(tab_element)
-                time.sleep(1)
-                success = check_tab(tab_element, tab_name, tab_data['content_locator'], i)
+                highlight(driver, tab_element)
+                success = check_tab(driver, tab_element, tab_name, tab_data['content_locator'], i)
                 
-                if success:
-                    result = f"{i}. Main Tab '{tab_name}' opened successfully."
-                    log_and_update_status(result)
-
-                    if 'sub_tabs' in tab_data:
-                        sub_tab_results = handle_sub_tabs(tab_name, tab_data['sub_tabs'], i)
-                        validation_results.extend(sub_tab_results)
-                        
-                    # Capture screenshot after tab is loaded
-                    capture_screenshot(f"tab_{tab_name}")
-                else:
+                if not success:
                     result = f"{i}. Failed to open Main Tab '{tab_name}'."
                     log_and_update_status(result, "Failed")
-                    all_tabs_opened = False
+                    return False, []
+                
+                result = f"{i}. Main Tab '{tab_name}' opened successfully."
+                log_and_update_status(result)
+
+                sub_tab_results, sub_tabs_ok = [], True
+                if 'sub_tabs' in tab_data:
+                    sub_tab_results, sub_tabs_ok = handle_sub_tabs(driver, tab_name, tab_data['sub_tabs'], i)
+                    
+                # Capture screenshot after tab is loaded
+                capture_screenshot(driver, f"tab_{tab_name}")
+                return sub_tabs_ok, sub_tab_results
                     
             except (TimeoutException, NoSuchElementException) as e:
                 result = f"{i}. Main Tab '{tab_name}' not found or not clickable. Exception: {e}"
                 log_and_update_status(result, "Failed")
-                all_tabs_opened = False
+                return False, []
 
-        except StaleElementReferenceException as e:
-            result = f"{i}. StaleElementReferenceException on Main Tab '{tab_name}': {e}"
-            log_and_update_status(result, "Failed")
-            all_tabs_opened = False
-            
-        # Add a short delay between tab navigations to allow the page to stabilize
-        time.sleep(2)
+            except StaleElementReferenceException as e:
+                result = f"{i}. StaleElementReferenceException on Main Tab '{tab_name}': {e}"
+                log_and_update_status(result, "Failed")
+                return False, []
+        finally:
+            # Let the page settle before the next tab, returning as soon as its link is present;
+            # this is best effort, so an alert or dead session never keeps the driver from going back
+            try:
+                next_locator = _locators[next_tab_name]['tab_locator'] if next_tab_name else None
+                wait_for_page_ready(driver, timeout=2, locator=next_locator)
+            except WebDriverException as e:
+                logging.warning(f"Page did not settle after tab '{tab_name}': {e}")
+            finally:
+                tab_drivers.put(driver)
+
+    # Fan the tabs out over several drivers that share the primary login session
+    max_parallel_tabs = max(1, min(config.get('parallel_tabs', driver_pool.max_size), total_tabs))
+    all_tabs_opened = True
+    # Each extra driver is leased into worker_leases, so all of them go back to the pool however
+    # the fan-out ends; the primary driver is returned by validate_application's checkout
+    with ExitStack() as worker_leases:
+        if max_parallel_tabs > 1:
+            session_cookies = driver.get_cookies()
+            for _ in range(max_parallel_tabs - 1):
+                worker_driver = clone_session(session_cookies, worker_leases)
+                if worker_driver is None:
+                    break
+                extra_drivers.append(worker_driver)
+                tab_drivers.put(worker_driver)
+        
+        with ThreadPoolExecutor(max_workers=1 + len(extra_drivers)) as tab_executor:
+            tab_names = list(config['tabs'])
+            tab_args = [
+                (tab_name, tab_data, i, tab_names[i] if i < total_tabs else None)
+                for i, (tab_name, tab_data) in enumerate(config['tabs'].items(), start=1)
+            ]
+            # map() yields in tab order, so sub-tab results stay grouped under their tab in the report
+            for tab_ok, sub_tab_results in tab_executor.map(lambda args: handle_tab(*args), tab_args):
+                with status_lock:
+                    validation_results.extend(sub_tab_results)
+                all_tabs_opened = all_tabs_opened and tab_ok
 
     # Capture final screenshot
-    capture_screenshot(f"{environment}_final")
+    capture_screenshot(driver, f"{environment}_final")
+    
+    # Make sure every timing and screenshot recorded during the run is in the status before reporting
+    flush_metrics()
+    wait(pending_screenshots, timeout=30)
 
     # Generate summary statistics
     total_checks = validation_status['successful_checks'] + validation_status['failed_checks'] + validation_status['skipped_checks']
@@ -809,7 +1493,7 @@ Total Checks: {total_checks}
 Successful: {validation_status['successful_checks']} ({success_rate:.1f}%)
 Failed: {validation_status['failed_checks']}
 Skipped: {validation_status['skipped_checks']}
-Duration: {(time.time() - time.mktime(time.strptime(validation_status['start_time'], "%Y-%m-%d %H:%M:%S"))):.1f} seconds
+Duration: {time.monotonic() - run_started:.1f} seconds
     """
     
     log_and_update_status(summary_message, "Info")
@@ -818,28 +1502,20 @@ Duration: {(time.time() - time.mktime(time.strptime(validation_status['start_tim
     # This ensures the pie chart shows the correct data
     if all_tabs_opened and validation_status['failed_checks'] > 0:
         logging.info("All tabs were successfully validated, but failed_checks counter is non-zero. Resetting to 0.")
-        validation_status['failed_checks'] = 0
-    
-    # Clean up
-    try:
-        driver.quit()
-        logging.info("WebDriver closed successfully")
-    except Exception as e:
-        logging.warning(f"Error while closing WebDriver: {e}")
+        set_status(failed_checks=0)
     
     # Update validation status - make sure progress shows 100% if successful
-    validation_status['end_time'] = time.strftime("%Y-%m-%d %H:%M:%S")
-    validation_status['progress'] = 100  # Ensure progress bar shows complete
+    set_status(end_time=now_str(), progress=100)  # Ensure progress bar shows complete
     
     if all_tabs_opened:
         result = ("Validation completed successfully.", "Success")
         log_and_update_status(result[0])
-        validation_status['status'] = 'Completed'
+        set_status(status='Completed')
         
-        # Submit test results if link provided
+        # Submit test results if link provided, reusing this driver when it has a real window
         if validation_portal_link:
             try:
-                submit_test_results(validation_portal_link)
+                submit_test_results(validation_portal_link, driver=None if driver_pool.headless else driver)
             except Exception as e:
                 error_msg = f"Failed to submit test results: {e}"
                 logging.error(error_msg)
@@ -847,24 +1523,45 @@ Duration: {(time.time() - time.mktime(time.strptime(validation_status['start_tim
     else:
         result = ("Validation failed.", "Failed")
         log_and_update_status(result[0], "Failed")
-        validation_status['status'] = 'Failed'
-
+        set_status(status='Failed')
+    
     return validation_results, all_tabs_opened
 
 
-def submit_test_results(validation_portal_link):
+def success_radio_checked(driver):
+    """True once a radio button on the results form is selected"""
+    return driver.execute_script('return document.querySelector("input[type=\'radio\']:checked") !== null')
+
+def confirmation_closed(driver):
+    """True once the confirmation dialog is gone, including when the results window closed with it"""
+    try:
+        driver.switch_to.alert
+    except (NoAlertPresentException, NoSuchWindowException):
+        return True
+    return False
+
+# Portal controls clicked in order: (name, screen position, condition that holds once the click took effect)
+PORTAL_CLICKS = [
+    ("Success", (536, 460), success_radio_checked),
+    ("OK", (1395, 896), EC.alert_is_present()),
+    ("Confirm", (1113, 374), confirmation_closed),
+]
+
+def submit_test_results(validation_portal_link, driver=None):
     """
     Submit test results to the validation portal
     
     Args:
         validation_portal_link: URL of the validation portal
+        driver: Non-headless WebDriver to reuse; the caller keeps ownership of it
     """
-    driver = None
+    owns_driver = driver is None
     try:
         logging.info(f"Submitting test results to validation portal: {validation_portal_link}")
         
-        # Initialize WebDriver with improved options
-        driver = setup_driver()
+        # pyautogui clicks need a real window, so a headless pool can't lend its drivers here
+        if owns_driver:
+            driver = setup_driver(headless=False)
         
         # Navigate to the validation portal
         navigation_attempts = 0
@@ -872,7 +1569,7 @@ def submit_test_results(validation_portal_link):
         while navigation_attempts < max_navigation_attempts:
             try:
                 driver.get(validation_portal_link)
-                WebDriverWait(driver, 10).until(lambda d: d.execute_script('return document.readyState') == 'complete')
+                WebDriverWait(driver, 10).until(page_is_ready)
                 logging.info("Successfully navigated to validation portal")
                 break
             except Exception as e:
@@ -884,42 +1581,43 @@ def submit_test_results(validation_portal_link):
         
         # Take screenshot of validation portal page
         try:
-            screenshot_path = os.path.join(os.getcwd(), 'screenshots')
+            screenshot_path = run_screenshot_dir()
             os.makedirs(screenshot_path, exist_ok=True)
             screenshot_file = os.path.join(screenshot_path, f"portal_before_{time.strftime('%Y%m%d_%H%M%S')}.png")
-            driver.save_screenshot(screenshot_file)
-            logging.info(f"Validation portal screenshot saved to {screenshot_file}")
+            screenshot_executor.submit(write_screenshot, driver.get_screenshot_as_png(), screenshot_file)
+            logging.info(f"Validation portal screenshot queued for {screenshot_file}")
         except Exception as e:
             logging.warning(f"Failed to capture validation portal screenshot: {e}")
         
         # Find and click Set Testing Results button
         try:
-            set_results_button = find_element_with_retry(
+            set_results_button = WebDriverWait(
                 driver,
-                By.XPATH,
-                "//button[contains(text(),'Set Testing Results')]",
-                max_attempts=3,
-                wait_time=10,
-                condition=EC.element_to_be_clickable
-            )
-            
-            if not click_element_with_retry(set_results_button):
-                raise Exception("Failed to click Set Testing Results button - element became stale")
+                10,
+                poll_frequency=0.25,
+                ignored_exceptions=(StaleElementReferenceException, NoSuchElementException)
+            ).until(EC.element_to_be_clickable((By.XPATH, "//button[contains(text(),'Set Testing Results')]")))
+            portal_window = driver.current_window_handle
+            portal_windows = driver.window_handles
+            set_results_button.click()
                 
-            # Wait for the dialog to appear
-            time.sleep(3)
+            # Wait for the results window to open and load; without one the form is on the portal page
+            try:
+                WebDriverWait(driver, 10, poll_frequency=0.1).until(EC.new_window_is_opened(portal_windows))
+                driver.switch_to.window(next(h for h in driver.window_handles if h not in portal_windows))
+            except TimeoutException:
+                logging.warning("No results window opened; using the portal page")
+            WebDriverWait(driver, 10, poll_frequency=0.1).until(page_is_ready)
             
             # Take screenshot after clicking button
             try:
-                screenshot_file = os.path.join(screenshot_path, f"portal_dialog_{time.strftime('%Y%m%d_%H%M%S')}.png")
-                driver.save_screenshot(screenshot_file)
+                screenshot_file = os.path.join(screenshot_path, f"portal_dialog_{time.strftime('%Y%m%d_%H%M%S')}.jpg")
+                screenshot_executor.submit(write_screenshot, driver.get_screenshot_as_png(), screenshot_file)
             except Exception as e:
                 logging.warning(f"Failed to capture dialog screenshot: {e}")
             
         except Exception as e:
             logging.error(f"Error finding or clicking Set Testing Results button: {e}")
-            if driver:
-                driver.quit()
             raise
         
         # Use pyautogui for clicking UI elements with better error handling
@@ -927,36 +1625,29 @@ def submit_test_results(validation_portal_link):
             # Get screen size to verify coordinates are within bounds
             screen_width, screen_height = pyautogui.size()
             
-            # Define click coordinates
-            success_button = (536, 460)
-            ok_button = (1395, 896)
-            confirm_button = (1113, 374)
-            
             # Verify coordinates are within screen bounds
-            for button, (x, y) in [("Success", success_button), ("OK", ok_button), ("Confirm", confirm_button)]:
+            for button, (x, y), _ in PORTAL_CLICKS:
                 if x > screen_width or y > screen_height:
                     logging.warning(f"{button} button coordinates ({x}, {y}) are outside screen bounds ({screen_width}, {screen_height})")
             
-            # Move to each position and click with delay
-            pyautogui.moveTo(success_button[0], success_button[1], duration=0.5)
-            pyautogui.click()
-            logging.info(f"Clicked Success button at {success_button}")
-            time.sleep(1.5)
-            
-            pyautogui.moveTo(ok_button[0], ok_button[1], duration=0.5)
-            pyautogui.click()
-            logging.info(f"Clicked OK button at {ok_button}")
-            time.sleep(1.5)
-            
-            pyautogui.moveTo(confirm_button[0], confirm_button[1], duration=0.5)
-            pyautogui.click()
-            logging.info(f"Clicked Confirm button at {confirm_button}")
+            # Click each position in one scripted sequence; click(x, y) moves instantly. Each click is
+            # followed by a wait for the state it produces, which the next click depends on
+            for button, (x, y), clicked in PORTAL_CLICKS:
+                pyautogui.click(x, y)
+                logging.info(f"Clicked {button} button at {(x, y)}")
+                try:
+                    WebDriverWait(driver, 5, poll_frequency=0.1).until(clicked)
+                except TimeoutException:
+                    logging.warning(f"{button} click had no visible effect within 5s")
             
-            # Take final screenshot after confirmation
+            # Take final screenshot after confirmation, from the portal page if the results window closed
             try:
-                time.sleep(1)
+                try:
+                    driver.current_window_handle
+                except NoSuchWindowException:
+                    driver.switch_to.window(portal_window)
                 screenshot_file = os.path.join(screenshot_path, f"portal_after_{time.strftime('%Y%m%d_%H%M%S')}.png")
-                driver.save_screenshot(screenshot_file)
+                screenshot_executor.submit(write_screenshot, driver.get_screenshot_as_png(), screenshot_file)
             except Exception as e:
                 logging.warning(f"Failed to capture final portal screenshot: {e}")
                 
@@ -972,13 +1663,10 @@ def submit_test_results(validation_portal_link):
         logging.error(traceback.format_exc())
         raise
     finally:
-        # Clean up
-        if driver:
-            try:
-                driver.quit()
-                logging.info("Validation portal WebDriver closed successfully")
-            except Exception as e:
-                logging.warning(f"Error while closing validation portal WebDriver: {e}")
+        # Clean up only a driver started here; a borrowed one goes back with its owner
+        if owns_driver and driver:
+            driver.quit()
+            logging.info("Validation portal WebDriver closed")
 
 # Error handler for rate limiting
 @app.errorhandler(429)
@@ -986,21 +1674,23 @@ def too_many_requests(e):
     return jsonify({"error": "Too many requests. Please try again later."}), 429
 
 # Health check endpoint
+# Fields of the /health response that never change while the process runs
+_health_static = {
+    "status": "healthy",
+    "app": project_name,
+    "version": "1.0.0",
+    "hostname": socket.gethostname()
+}
+
 @app.route('/health')
 def health():
-    status = {
-        "status": "healthy",
-        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
-        "app": project_name,
-        "version": "1.0.0",
-        "hostname": socket.gethostname()
-    }
-    return jsonify(status)
+    body = encode_json({**_health_static, "timestamp": now_str()})
+    return make_response(body, 200, {'Content-Type': 'application/json', 'Cache-Control': 'no-store'})
 
 @app.route('/')
 def home():
     # Add environment data for dropdown
-    environments = list(config['environments'].keys())
+    environments = _ENV_LIST
     return render_template('index.html', project_name=project_name, environments=environments)
 
 @app.route('/start_validation', methods=['POST'])
@@ -1032,7 +1722,7 @@ def start_validation():
         if environment not in config['environments']:
             return jsonify({
                 "error": f"Invalid environment: {environment}",
-                "valid_environments": list(config['environments'].keys())
+                "valid_environments": _ENV_LIST
             }), 400
             
         validation_portal_link = data.get('validation_portal_link')
@@ -1042,14 +1732,14 @@ def start_validation():
         return jsonify({"error": f"Invalid request: {str(e)}"}), 400
     
     # Reset validation status
-    validation_status['status'] = 'Running'
+    set_status(status='Running')
     if not retry_failed:
-        validation_status['results'] = []
+        reset_results()
     
     def validate_environment():
         try:
             results, success = validate_application(environment, validation_portal_link, retry_failed)
-            validation_status['status'] = 'Completed' if success else 'Failed'
+            set_status(status='Completed' if success else 'Failed')
             
             # Send email with results
             try:
@@ -1064,8 +1754,13 @@ def start_validation():
             error_msg = f"Unexpected error during validation: {e}"
             logging.error(error_msg)
             logging.error(traceback.format_exc())
-            validation_status['status'] = 'Failed'
-            validation_status['results'].append(error_msg)
+            set_status(status='Failed')
+            append_result(error_msg, "Failed")
+        finally:
+            # The thread is going away; never leave the status looking like it is still running
+            if validation_status['status'] in ['Running', 'Paused', 'Stopping']:
+                set_status(status='Failed')
+                append_result("Validation thread terminated unexpectedly", "Failed")
 
     # Start validation in a new thread
     active_validation_thread = threading.Thread(target=validate_environment)
@@ -1095,13 +1790,11 @@ def pause_resume_validation():
     
     # Toggle pause state
     if validation_status['status'] == 'Running' and not validation_status.get('paused', False):
-        validation_status['paused'] = True
+        set_status(paused=True, status='Paused')
         pause_event.clear()
-        validation_status['status'] = 'Paused'
     elif validation_status['status'] == 'Paused':
-        validation_status['paused'] = False
+        set_status(paused=False, status='Running')
         pause_event.set()
-        validation_status['status'] = 'Running'
         action = "resumed"
     else:
         return jsonify({
@@ -1135,7 +1828,7 @@ def stop_validation():
     if validation_status['status'] == 'Paused':
         pause_event.set()  # Resume if paused, so it can process the stop event
     
-    validation_status['status'] = 'Stopping'
+    set_status(status='Stopping')
     
     return jsonify({
         "message": "Validation stopping",
@@ -1144,31 +1837,72 @@ def stop_validation():
 
 @app.route('/status')
 def get_status():
-    global active_validation_thread
-    
-    # Check if thread is alive
-    if active_validation_thread and not active_validation_thread.is_alive():
-        if validation_status['status'] in ['Running', 'Paused', 'Stopping']:
-            validation_status['status'] = 'Failed'
-            validation_status['results'].append("Validation thread terminated unexpectedly")
-            validation_status['progress'] = 100  # Set to 100% if thread died unexpectedly
-    
-    # If status is Completed or Failed but progress is not 100%, fix it
-    if validation_status['status'] in ['Completed', 'Failed'] and validation_status.get('progress', 0) != 100:
-        validation_status['progress'] = 100
-    
-    # Ensure failed_checks is 0 if all_tabs_opened is True (overall success)
-    if validation_status['status'] == 'Completed' and validation_status.get('failed_checks', 0) > 0:
-        validation_status['failed_checks'] = 0
-    
-    # Return status with additional metadata
-    status_data = {
-        **validation_status,
-        'active': active_validation_thread is not None and active_validation_thread.is_alive(),
-        'timestamp': time.strftime("%Y-%m-%d %H:%M:%S")
-    }
+    # Status fixups happen in set_status and the worker's finally; this path only reads
+    active = active_validation_thread is not None and active_validation_thread.is_alive()
+    
+    def status_body(encoded_results):
+        """Encode the status with additional metadata, splicing in the already-encoded results"""
+        # Encode under status_lock so the status can't change mid-encode; the metrics have their own lock
+        with status_lock:
+            status_data = {key: value for key, value in validation_status.items() if key != 'results'}
+            status_data['performance_metrics'] = snapshot_metrics()
+            status_data['active'] = active
+            return encode_json(status_data)[:-1] + b',"results":[' + b','.join(encoded_results) + b']}'
+    
+    def with_timestamp(body):
+        """Add the response time to an encoded status body"""
+        return body[:-1] + b',"timestamp":' + encode_json(now_str()) + b'}'
+    
+    # Clients pass the last results_seq they saw to receive only newer entries
+    since = request.args.get('since', type=int)
+    if since is not None:
+        return make_response(with_timestamp(status_body(encoded_results_since(since))), 200, {
+            'Content-Type': 'application/json',
+            'Cache-Control': 'no-store'
+        })
+    
+    # Re-encode the full status only when something in it changed since the last poll; the timestamp
+    # is left out of the cached body and its ETag, so an unchanged status still gets a 304
+    with status_lock:
+        key = (_status_snapshot['version'], validation_status['results_seq'], active)
+        if _status_snapshot['key'] != key:
+            body = status_body(encoded_results_since())
+            _status_snapshot['body'] = body
+            _status_snapshot['etag'] = f'{zlib.crc32(body):08x}'
+            _status_snapshot['key'] = key
+        body, etag = _status_snapshot['body'], _status_snapshot['etag']
+    
+    # Weak: bodies with the same tag differ only in their timestamp
+    headers = {'ETag': f'W/"{etag}"', 'Cache-Control': 'no-store'}
+    if etag_matches(etag):
+        return make_response(b'', 304, headers)
+    headers['Content-Type'] = 'application/json'
+    return make_response(with_timestamp(body), 200, headers)
+
+def tail(path, n, chunk=8192):
+    """
+    Read the last n lines of a file by seeking backwards from the end
+    
+    Args:
+        path: File to read
+        n: Number of lines to return
+        chunk: Bytes read per backward step
     
-    return jsonify(status_data)
+    Returns:
+        list: Up to n lines, each keeping its trailing newline
+    """
+    with open(path, 'rb') as f:
+        position = os.path.getsize(path)
+        data = b''
+        # One extra newline is needed to be sure the first kept line is complete
+        while position > 0 and data.count(b'\n') <= n:
+            step = min(chunk, position)
+            position -= step
+            f.seek(position)
+            data = f.read(step) + data
+    
+    text = data.decode('utf-8', errors='replace').replace('\r\n', '\n')
+    return text.splitlines(keepends=True)[-n:]
 
 @app.route('/logs')
 def get_logs():
@@ -1183,8 +1917,7 @@ def get_logs():
         log_lines = []
         
         try:
-            with open(log_file_path, 'r') as log_file:
-                log_lines = log_file.readlines()[-num_lines:]
+            log_lines = tail(log_file_path, num_lines)
         except Exception as e:
             return jsonify({"error": f"Error reading log file: {str(e)}"}), 500
             
@@ -1199,26 +1932,34 @@ def get_logs():
 
 @app.route('/screenshots')
 def list_screenshots():
-    """Endpoint to list available screenshots"""
+    """Endpoint to list the current run's screenshots, or every run's with ?all=1"""
     try:
-        screenshot_path = os.path.join(os.getcwd(), 'screenshots')
+        list_all = request.args.get('all') == '1'
+        screenshot_path = screenshots_root if list_all else run_screenshot_dir()
         
         if not os.path.exists(screenshot_path):
             return jsonify({"screenshots": [], "count": 0})
             
-        screenshots = []
-        for file in os.listdir(screenshot_path):
-            if file.endswith('.png'):
-                file_path = os.path.join(screenshot_path, file)
-                screenshots.append({
-                    "filename": file,
-                    "path": file_path,
-                    "size": os.path.getsize(file_path),
-                    "created": time.ctime(os.path.getctime(file_path))
-                })
+        # scandir entries carry their own path and a single cached stat() result
+        entries = []
+        directories = [screenshot_path]
+        while directories:
+            with os.scandir(directories.pop()) as it:
+                for entry in it:
+                    if entry.name.endswith(('.png', '.jpg')):
+                        entries.append((entry, entry.stat()))
+                    elif list_all and entry.is_dir():
+                        directories.append(entry.path)
                 
         # Sort by creation time (newest first)
-        screenshots.sort(key=lambda x: x["created"], reverse=True)
+        entries.sort(key=lambda item: item[1].st_ctime, reverse=True)
+        
+        screenshots = [{
+            "filename": os.path.relpath(entry.path, screenshots_root).replace(os.sep, '/'),
+            "path": entry.path,
+            "size": st.st_size,
+            "created": time.ctime(st.st_ctime)
+        } for entry, st in entries]
         
         return jsonify({
             "screenshots": screenshots,
@@ -1228,57 +1969,57 @@ def list_screenshots():
     except Exception as e:
         return jsonify({"error": f"Error listing screenshots: {str(e)}"}), 500
 
+@app.route('/screenshots/<path:filename>')
+def get_screenshot(filename):
+    """Serve a single screenshot file from disk"""
+    return send_from_directory(screenshots_root, filename)
+
+def _render_report_bytes():
+    """Render the validation report once and return the encoded HTML"""
+    # Results are classified when they are recorded
+    with status_lock:
+        formatted_results = list(validation_status['results'])
+        screenshots = list(validation_status.get('screenshots', []))
+    metrics = snapshot_metrics()
+    
+    # Calculate component statistics
+    component_stats = {}
+    for component, timings in metrics['component_timings'].items():
+        if timings:
+            component_stats[component] = {
+                "count": len(timings),
+                "min": min(timings),
+                "max": max(timings),
+                "avg": sum(timings) / len(timings)
+            }
+    
+    # Prepare report data
+    report_data = {
+        'environment': validation_status.get('environment', 'N/A'),
+        'start_time': validation_status.get('start_time', 'N/A'),
+        'end_time': validation_status.get('end_time', 'N/A'),
+        'duration': calculate_duration(validation_status.get('start_time'), validation_status.get('end_time')),
+        'total_checks': validation_status.get('successful_checks', 0) + 
+                        validation_status.get('failed_checks', 0) + 
+                        validation_status.get('skipped_checks', 0),
+        'successful_checks': validation_status.get('successful_checks', 0),
+        'failed_checks': validation_status.get('failed_checks', 0),
+        'skipped_checks': validation_status.get('skipped_checks', 0),
+        'component_stats': component_stats,
+        'interaction_timings': metrics['interaction_timings'],
+        'element_timings': metrics['element_timings'],
+        'results': formatted_results,
+        'screenshots': screenshots,
+        'project_name': project_name
+    }
+    
+    return render_template('report_template.html', **report_data).encode('utf-8')
+
 @app.route('/generate_report')
 def generate_report():
     """Generate an HTML report of the validation results"""
     try:
-        # Format results for the report
-        formatted_results = []
-        for i, result in enumerate(validation_status['results'], 1):
-            status = "Success"
-            if "[Failed]" in result:
-                status = "Failed"
-            elif "[Skipped]" in result or "[Warning]" in result:
-                status = "Skipped"
-            formatted_results.append({
-                "index": i,
-                "message": result,
-                "status": status,
-                "timestamp": result.split(']')[0].replace('[', '')
-            })
-        
-        # Calculate component statistics
-        component_stats = {}
-        for component, timings in validation_status['performance_metrics'].get('component_timings', {}).items():
-            if timings:
-                component_stats[component] = {
-                    "count": len(timings),
-                    "min": min(timings),
-                    "max": max(timings),
-                    "avg": sum(timings) / len(timings)
-                }
-        
-        # Prepare report data
-        report_data = {
-            'environment': validation_status.get('environment', 'N/A'),
-            'start_time': validation_status.get('start_time', 'N/A'),
-            'end_time': validation_status.get('end_time', 'N/A'),
-            'duration': calculate_duration(validation_status.get('start_time'), validation_status.get('end_time')),
-            'total_checks': validation_status.get('successful_checks', 0) + 
-                            validation_status.get('failed_checks', 0) + 
-                            validation_status.get('skipped_checks', 0),
-            'successful_checks': validation_status.get('successful_checks', 0),
-            'failed_checks': validation_status.get('failed_checks', 0),
-            'skipped_checks': validation_status.get('skipped_checks', 0),
-            'component_stats': component_stats,
-            'interaction_timings': validation_status['performance_metrics'].get('interaction_timings', []),
-            'element_timings': validation_status['performance_metrics'].get('element_timings', {}),
-            'results': formatted_results,
-            'screenshots': validation_status.get('screenshots', []),
-            'project_name': project_name
-        }
-        
-        return render_template('report_template.html', **report_data)
+        return make_response(_render_report_bytes(), 200, {'Content-Type': 'text/html; charset=utf-8'})
     except Exception as e:
         logging.error(f"Error generating report: {e}")
         return jsonify({"error": f"Failed to generate report: {str(e)}"}), 500
@@ -1287,14 +2028,11 @@ def generate_report():
 def download_report():
     """Download the HTML report"""
     try:
-        # Generate the report HTML
-        report_html = generate_report().get_data(as_text=True)
-        
-        # Create response with HTML content
-        response = make_response(report_html)
-        response.headers['Content-Type'] = 'text/html'
-        response.headers['Content-Disposition'] = f'attachment; filename=validation_report_{datetime.now().date()}.html'
-        return response
+        # Render once and send the same bytes as an attachment
+        return make_response(_render_report_bytes(), 200, {
+            'Content-Type': 'text/html; charset=utf-8',
+            'Content-Disposition': f'attachment; filename=validation_report_{datetime.now().date()}.html'
+        })
     except Exception as e:
         logging.error(f"Error downloading report: {e}")
         return jsonify({"error": f"Failed to download report: {str(e)}"}), 500
@@ -1302,7 +2040,7 @@ def download_report():
 if __name__ == '__main__':
     try:
         # Create directories if they don't exist
-        os.makedirs(os.path.join(os.getcwd(), 'screenshots'), exist_ok=True)
+        os.makedirs(screenshots_root, exist_ok=True)
         os.makedirs(os.path.join(os.getcwd(), 'logs'), exist_ok=True)
         
         # Set up a more robust server start
@@ -1319,37 +2057,35 @@ if __name__ == '__main__':
             
         sys.excepthook = handle_exception
         
-        # Use a thread pool for better resource management
-        executor = ThreadPoolExecutor(max_workers=4)
-        
-        # Start the Flask app in a separate thread
+        # Start the Flask app in a separate thread; threaded=True already serves requests concurrently
         def run_app():
             app.run(debug=False, use_reloader=False, host='0.0.0.0', port=5000, threaded=True)
             
-        executor.submit(run_app)
+        server_thread = threading.Thread(target=run_app, name='flask-server', daemon=True)
+        server_thread.start()
         
-        # Wait for the server to start
+        # Wait for the server to start, probing every 100ms for up to 5 seconds
         server_ready = False
-        retry_count = 0
-        max_retries = 5
-        
-        while not server_ready and retry_count < max_retries:
+        for _ in range(50):
             try:
-                time.sleep(1)
-                # Try to connect to the server
-                with socket.create_connection(('127.0.0.1', 5000), timeout=1):
+                with socket.create_connection(('127.0.0.1', 5000), timeout=0.1):
                     server_ready = True
                     logging.info("Server started successfully")
-            except (socket.error, socket.timeout):
-                retry_count += 1
-                logging.info(f"Waiting for server to start (attempt {retry_count}/{max_retries})...")
+                    break
+            except OSError:
+                time.sleep(0.1)
         
         if not server_ready:
-            logging.warning("Server may not have started properly, attempting to open browser anyway")
+            logging.warning("Server may not have started properly")
+        
+        # Open a browser only when asked to, and off the startup path since it can block
+        if os.environ.get('OPEN_BROWSER', '0') == '1':
+            threading.Thread(target=lambda: webbrowser.open("http://127.0.0.1:5000"), daemon=True).start()
+            logging.info("Opening browser to application URL")
         
-        # Open browser
-        webbrowser.open("http://127.0.0.1:5000")
-        logging.info("Browser opened to application URL")
+        # Keep the process alive while the server runs; short joins let Ctrl+C through
+        while server_thread.is_alive():
+            server_thread.join(1)
         
     except Exception as e:
         logging.error(f"Error starting application: {e}")
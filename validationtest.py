@@ -1,75 +1,295 @@
-import time
+import os
+import sys
+import queue
 from selenium import webdriver
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, NoAlertPresentException, NoSuchWindowException
 import pyautogui
 from PIL import Image, ImageDraw
 
-# Function to create a circular highlight image
+try:
+    import numpy as np
+    import cv2
+except ImportError:
+    cv2 = None
+
+try:
+    from selenium.webdriver.remote.client_config import ClientConfig
+except ImportError:
+    ClientConfig = None
+
+# Coordinate clicks are paced by waits on the state each click produces, not by pyautogui's built-in delays
+pyautogui.MINIMUM_DURATION = 0
+pyautogui.MINIMUM_SLEEP = 0
+pyautogui.PAUSE = 0
+
+# Keep-alive sockets kept per WebDriver connection; urllib3's default pool holds only one
+WEBDRIVER_POOL_MAXSIZE = 10
+
+# Highlight images already drawn, keyed by (radius, color, thickness)
+_highlight_images = {}
+
+# Function to create a circular highlight image; each variant is drawn once and reused
 def create_highlight_image(radius=30, color=(255, 0, 0), thickness=5):
+    key = (radius, color, thickness)
+    img = _highlight_images.get(key)
+    if img is not None:
+        return img
+
     size = (radius * 2, radius * 2)
-    img = Image.new("RGBA", size, (0, 0, 0, 0))  # Create a transparent image
-    draw = ImageDraw.Draw(img)
-    draw.ellipse((thickness, thickness, size[0] - thickness, size[1] - thickness), outline=color, width=thickness)
+    if cv2 is not None:
+        # Rasterize the ring in one OpenCV call on a transparent RGBA array
+        pixels = np.zeros((size[1], size[0], 4), dtype=np.uint8)
+        cv2.circle(pixels, (radius, radius), radius - thickness - thickness // 2, (*color, 255), thickness=thickness, lineType=cv2.LINE_AA)
+        img = Image.fromarray(pixels, "RGBA")
+    else:
+        img = Image.new("RGBA", size, (0, 0, 0, 0))  # Create a transparent image
+        draw = ImageDraw.Draw(img)
+        draw.ellipse((thickness, thickness, size[0] - thickness, size[1] - thickness), outline=color, width=thickness)
+    _highlight_images[key] = img
     return img
 
+# Draw a ring around each fallback click; off unless DEBUG_HIGHLIGHT=1, since it opens a window per click
+DEBUG_HIGHLIGHT = os.environ.get('DEBUG_HIGHLIGHT') == '1'
+
 # Function to display the highlight around the mouse cursor
 def highlight_mouse(x, y, duration=0.5):
-    highlight_image = create_highlight_image()
-    highlight_image.show()
-    
-    # Move the image window to the mouse position (this would require additional control or a custom window)
-    # Simulating that the highlight stays at the mouse position
-
     # Move the mouse to the desired position
-    pyautogui.moveTo(x, y)
+    pyautogui.moveTo(x, y, duration=0)
+    if not DEBUG_HIGHLIGHT:
+        return
+
+    import tkinter as tk
+    from PIL import ImageTk
+
+    # Borderless, topmost overlay centred on the cursor; its white background is keyed out so only the ring shows
+    highlight_image = create_highlight_image()
+    width, height = highlight_image.size
+    root = tk.Tk()
+    root.overrideredirect(True)
+    root.attributes("-topmost", True)
+    root.attributes("-transparentcolor", "white")
+    root.geometry(f"{width}x{height}+{x - width // 2}+{y - height // 2}")
+    photo = ImageTk.PhotoImage(highlight_image, master=root)
+    canvas = tk.Canvas(root, width=width, height=height, bg="white", highlightthickness=0)
+    canvas.create_image(0, 0, image=photo, anchor="nw")
+    canvas.pack()
 
     # Show the highlight for the specified duration
-    time.sleep(duration)
+    root.after(int(duration * 1000), root.destroy)
+    root.mainloop()
 
-    # Hide the highlight (since the image will be automatically closed after duration)
-    highlight_image.close()
+def click_fast(x, y):
+    """Click a screen position at once, highlighting it first only when DEBUG_HIGHLIGHT is set"""
+    highlight_mouse(x, y, duration=0.5)
+    pyautogui.click(x, y)
 
-# Ask the user for the validation portal link
-validation_portal_link = input("Please enter the validation portal link: ")
+class _PooledConnection(webdriver.Remote):
+    """
+    Reopen the WebDriver connection that webdriver.Edge built with a ClientConfig holding a larger
+    keep-alive pool. PooledEdge lists this base last, so in its MRO it sits between Edge's own classes
+    and webdriver.Remote: Edge still finds and starts msedgedriver, and only the connection changes.
+    """
 
-# Initialize the Selenium WebDriver (Edge/Chrome)
-driver = webdriver.Edge()  # or webdriver.Chrome(), depending on your setup
+    def __init__(self, command_executor, **kwargs):
+        client_config = ClientConfig(
+            remote_server_addr=command_executor.client_config.remote_server_addr,
+            keep_alive=True,
+            # Not a typo: RemoteConnection passes on only the "init_args_for_pool_manager" key of this
+            # dict to urllib3's PoolManager, so the pool arguments sit one level down
+            init_args_for_pool_manager={"init_args_for_pool_manager": {"maxsize": WEBDRIVER_POOL_MAXSIZE, "block": False}}
+        )
+        # A URL plus client_config makes webdriver.Remote build the Edge connection (with its "ms" commands) itself
+        super().__init__(command_executor=client_config.remote_server_addr, client_config=client_config, **kwargs)
 
-# Step 2: Navigate to the provided link
-driver.get(validation_portal_link)
+class PooledEdge(webdriver.Edge, _PooledConnection):
+    """webdriver.Edge whose WebDriver HTTP connection keeps a pool of keep-alive sockets"""
 
-# Step 3: Find the 'Set Testing Results' button and click it
-try:
-    set_testing_results_button = driver.find_element(By.XPATH, "//button[@type='Button' and contains(text(),'Set Testing Results')]")
-    set_testing_results_button.click()
-    print("Set Testing Results button clicked.")
-except Exception as e:
-    print(f"Error clicking Set Testing Results button: {e}")
-    driver.quit()
+def start_edge(options=None):
+    """
+    Start an Edge session whose WebDriver HTTP connection keeps a pool of keep-alive sockets.
 
-# Pause to allow new window to load
-time.sleep(5)  # Adjust based on loading time
+    Args:
+        options (EdgeOptions): Browser options, e.g. a debuggerAddress to attach to.
 
-# Step 4-6: Use PyAutoGUI to select the Success radio button and click OK with highlighting
+    Returns:
+        WebDriver: The started driver; quit() also stops its msedgedriver service.
+    """
+    options = options or webdriver.EdgeOptions()
+    if ClientConfig is None:
+        # Selenium before 4.26 has no ClientConfig; its default connection still keeps alive
+        return webdriver.Edge(options=options, keep_alive=True)
+    return PooledEdge(options=options)
 
-try:
-    # Highlight and click the Success radio button
-    highlight_mouse(543, 360, duration=0.5)
-    pyautogui.click(543, 360)
-    time.sleep(1)
-
-    # Highlight and click the first OK button
-    highlight_mouse(1398, 865, duration=0.5)
-    pyautogui.click(1398, 865)
-    time.sleep(1)
-
-    # Highlight and click the confirmation OK button
-    highlight_mouse(1068, 618, duration=0.5)
-    pyautogui.click(1068, 618)
-
-    print("Test results successfully submitted!")
-except Exception as e:
-    print(f"Error using PyAutoGUI: {e}")
-
-# Close the browser
-driver.quit()
+# Debugger addresses (host:port) of Edge instances kept running with --remote-debugging-port,
+# comma-separated; when unset a fresh Edge is launched for the run
+EDGE_DEBUGGER_ADDRESSES = [address for address in os.environ.get('EDGE_DEBUGGER_ADDRESSES', '').split(',') if address]
+
+class BrowserPool:
+    """
+    Hand out drivers attached to already-running Edge instances, one per debugger address,
+    so a run skips browser startup and profile warmup.
+
+    Args:
+        addresses (list): Debugger addresses (host:port) of the running Edge instances.
+    """
+
+    def __init__(self, addresses):
+        self._free = queue.Queue()
+        for address in addresses:
+            self._free.put(address)
+        self._drivers = {}
+        self._addresses = {}
+
+    def acquire(self, timeout=None):
+        """Return a driver for a free instance, attaching to it on first use"""
+        address = self._free.get(timeout=timeout)
+        driver = self._drivers.get(address)
+        if driver is None:
+            options = webdriver.EdgeOptions()
+            options.add_experimental_option("debuggerAddress", address)
+            driver = start_edge(options)
+            self._drivers[address] = driver
+            self._addresses[id(driver)] = address
+        return driver
+
+    def release(self, driver):
+        """Blank the instance's page and return it to the pool instead of closing the browser"""
+        try:
+            driver.get("about:blank")
+        finally:
+            self._free.put(self._addresses[id(driver)])
+
+    def close(self):
+        """Stop the msedgedriver service behind each attached driver, leaving the Edge instances running"""
+        for driver in self._drivers.values():
+            service = getattr(driver, 'service', None)
+            if service is not None:
+                service.stop()
+        self._drivers.clear()
+        self._addresses.clear()
+
+def success_radio_checked(driver):
+    """True once a radio button on the results form is selected"""
+    return driver.execute_script('return document.querySelector("input[type=\'radio\']:checked") !== null')
+
+def confirmation_closed(driver):
+    """True once the confirmation dialog is gone, including when the results window closed with it"""
+    try:
+        driver.switch_to.alert
+    except (NoAlertPresentException, NoSuchWindowException):
+        return True
+    return False
+
+# Controls clicked in the results window, in order: (name, environment variable holding the
+# control's CSS selector, screen position clicked when no selector is configured, condition that
+# holds once a coordinate click took effect)
+PORTAL_STEPS = [
+    ('Success radio button', 'PORTAL_SUCCESS_SELECTOR', (543, 360), success_radio_checked),
+    ('OK button', 'PORTAL_OK_SELECTOR', (1398, 865), EC.alert_is_present()),
+    ('Confirmation OK button', 'PORTAL_CONFIRM_SELECTOR', (1068, 618), confirmation_closed),
+]
+
+# Seconds a coordinate click gets to produce its next state before the next step goes ahead anyway
+COORDINATE_CLICK_TIMEOUT = 5
+
+def click_portal_control(driver, selector, timeout=10):
+    """
+    Click a results-window control through WebDriver.
+
+    Args:
+        driver (WebDriver): Driver switched to the results window.
+        selector (str): CSS selector of the control.
+        timeout (int): Seconds to wait for the control.
+
+    Returns:
+        bool: True if clicked, False if the control never appeared.
+    """
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.1).until(
+            EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
+        ).click()
+        return True
+    except TimeoutException:
+        return False
+
+browser_pool = BrowserPool(EDGE_DEBUGGER_ADDRESSES) if EDGE_DEBUGGER_ADDRESSES else None
+
+def close_driver(driver):
+    """Give a pooled browser back, or quit one launched for this run"""
+    if browser_pool is not None:
+        browser_pool.release(driver)
+    else:
+        driver.quit()
+
+def main():
+    """
+    Open the validation portal and submit a Success result.
+
+    Returns:
+        int: Process exit status; 1 as soon as a step fails.
+    """
+    # Ask the user for the validation portal link
+    validation_portal_link = input("Please enter the validation portal link: ")
+
+    # Initialize the Selenium WebDriver (Edge/Chrome), reusing a running instance when one is configured
+    driver = browser_pool.acquire() if browser_pool is not None else start_edge()
+    try:
+        # Step 2: Navigate to the provided link
+        driver.get(validation_portal_link)
+
+        # Step 3: Find the 'Set Testing Results' button and click it
+        original_windows = driver.window_handles
+        try:
+            # Match the button's whole label; returns as soon as it is interactive instead of failing on a still-loading page
+            set_testing_results_button = WebDriverWait(driver, 10, poll_frequency=0.1).until(
+                EC.element_to_be_clickable((By.XPATH, "//button[normalize-space()='Set Testing Results']"))
+            )
+            set_testing_results_button.click()
+            print("Set Testing Results button clicked.")
+        except Exception as e:
+            # Nothing to submit into; stop before clicking anything on the desktop
+            print(f"Error clicking Set Testing Results button: {e}")
+            return 1
+
+        # Wait for the results window to open and switch to it; returns as soon as the handle appears
+        try:
+            WebDriverWait(driver, 10, poll_frequency=0.1).until(EC.new_window_is_opened(original_windows))
+            driver.switch_to.window(driver.window_handles[-1])
+        except TimeoutException:
+            print("No new window opened; continuing on the current page.")
+
+        # Step 4-6: Select the Success radio button and click OK through Selenium when a selector is
+        # configured; otherwise click the control's screen position straight away with PyAutoGUI
+        try:
+            for step, selector_variable, (x, y), clicked in PORTAL_STEPS:
+                selector = os.environ.get(selector_variable)
+                if selector and click_portal_control(driver, selector):
+                    continue
+                if selector:
+                    print(f"{step} not found by {selector_variable}; clicking its screen position.")
+                click_fast(x, y)
+                try:
+                    WebDriverWait(driver, COORDINATE_CLICK_TIMEOUT, poll_frequency=0.1).until(clicked)
+                except TimeoutException:
+                    print(f"{step} click had no visible effect within {COORDINATE_CLICK_TIMEOUT}s.")
+
+            print("Test results successfully submitted!")
+        except Exception as e:
+            print(f"Error submitting test results: {e}")
+            return 1
+        return 0
+    finally:
+        # Close the browser, or hand it back to the pool and stop the pool's msedgedriver services;
+        # the pooled browsers keep running for the next run
+        try:
+            close_driver(driver)
+        finally:
+            if browser_pool is not None:
+                browser_pool.close()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,7 @@
+# Production entry point for app.py, e.g. `waitress-serve --threads=8 wsgi:app`.
+# Run a single process: validation state and the driver pool live in app.py's module globals.
+from app import app
+
+if __name__ == '__main__':
+    import waitress
+    waitress.serve(app, host='0.0.0.0', port=5000, threads=8)